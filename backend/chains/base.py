@@ -3,18 +3,91 @@ Base Chain Adapter Interface
 Defines the common interface for all blockchain adapters
 """
 
+import asyncio
+import functools
+import importlib
+import logging
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
 
-class ChainType(Enum):
+# Shared JSON-RPC transport; json helpers are re-exported here for the adapters
+from ..rpc_client import RpcPool, get_rpc_pool, json_dumps, json_loads
+
+logger = logging.getLogger(__name__)
+
+
+def async_ttl_cache(
+    ttl: float = 30, maxsize: int = 1024, fallback: Optional[Callable] = None
+) -> Callable:
+    """
+    Memoize an async adapter method ``(self, address, ...)`` for ``ttl`` seconds
+    
+    Results are keyed by ``(chain_type, rpc_url, address)`` plus any extra
+    arguments. Concurrent callers for the same key wait on a per-key lock, so
+    a burst of identical lookups makes a single upstream fetch.
+    
+    If the method raises and ``fallback`` is given, the error is logged and
+    ``fallback(self, address)`` is returned without being cached, so a
+    transient upstream failure is retried on the next call.
+    """
+    def decorator(func: Callable) -> Callable:
+        cache: Dict[tuple, tuple[float, Any]] = {}
+        locks: Dict[tuple, asyncio.Lock] = {}
+        
+        def lookup(key: tuple) -> tuple[bool, Any]:
+            item = cache.get(key)
+            if item is not None and item[0] > time.time():
+                return True, item[1]
+            return False, None
+        
+        @functools.wraps(func)
+        async def wrapper(self, address: str, *args, **kwargs):
+            key = (
+                self.chain_type, self.rpc_url, address.lower(), *args, *sorted(kwargs.items())
+            )
+            hit, value = lookup(key)
+            if hit:
+                return value
+            
+            lock = locks.setdefault(key, asyncio.Lock())
+            try:
+                async with lock:
+                    hit, value = lookup(key)
+                    if hit:
+                        return value
+                    try:
+                        value = await func(self, address, *args, **kwargs)
+                    except Exception as e:
+                        if fallback is None:
+                            raise
+                        logger.error(f"{func.__name__} failed for {address}: {e}")
+                        return fallback(self, address)
+                    if len(cache) >= maxsize:
+                        now = time.time()
+                        for stale in [k for k, (exp, _) in cache.items() if exp <= now]:
+                            del cache[stale]
+                        if len(cache) >= maxsize:
+                            cache.pop(next(iter(cache)))
+                    cache[key] = (time.time() + ttl, value)
+                    return value
+            finally:
+                if not lock.locked():
+                    locks.pop(key, None)
+        
+        return wrapper
+    return decorator
+
+
+class ChainType(str, Enum):
     """Supported blockchain types"""
     SEI = "sei"
     ETHEREUM = "eth"
     SOLANA = "sol"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WalletProfile:
     """Standardized wallet profile across all chains"""
     address: str
@@ -29,7 +102,7 @@ class WalletProfile:
     risk_score: float
     confidence: float
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StakingMetrics:
     """Standardized staking metrics across all chains"""
     total_staked: float
@@ -40,7 +113,7 @@ class StakingMetrics:
     is_active_staker: bool
     staking_score: float
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GovernanceMetrics:
     """Standardized governance metrics across all chains"""
     total_votes_cast: int
@@ -51,7 +124,7 @@ class GovernanceMetrics:
     is_active_voter: bool
     governance_score: float
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProtocolInteraction:
     """Standardized protocol interaction data"""
     protocol_name: str
@@ -61,7 +134,7 @@ class ProtocolInteraction:
     last_interaction_timestamp: Optional[int]
     risk_level: str  # low, medium, high
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TokenBalance:
     """Standardized token balance data"""
     token_address: str
@@ -81,9 +154,10 @@ class ChainAdapter(ABC):
     consistent data structures across different blockchains.
     """
     
-    def __init__(self, chain_type: ChainType, rpc_url: str):
+    def __init__(self, chain_type: ChainType, rpc_url: str, redis_client=None):
         self.chain_type = chain_type
         self.rpc_url = rpc_url
+        self.redis_client = redis_client
         self.is_connected = False
     
     @abstractmethod
@@ -215,6 +289,30 @@ class ChainAdapter(ABC):
             'status': 'healthy' if self.is_connected else 'disconnected'
         }
     
+    async def _cache_get(self, key: Optional[str]) -> Optional[Any]:
+        """Read a JSON value from the shared Redis cache, if configured (None key: miss)"""
+        if self.redis_client is None or key is None:
+            return None
+        try:
+            cached = await self.redis_client.get(key)
+            return json_loads(cached) if cached else None
+        except Exception as e:
+            logger.warning(f"Cache error: {e}")
+            return None
+    
+    async def _cache_set(self, key: Optional[str], value: Any, ttl: float) -> None:
+        """Write a JSON value to the shared Redis cache, if configured (None key: skip)"""
+        if self.redis_client is None or key is None:
+            return
+        try:
+            await self.redis_client.setex(key, max(1, int(ttl)), json_dumps(value))
+        except Exception as e:
+            logger.warning(f"Failed to cache {key}: {e}")
+    
+    def rpc_pool(self) -> RpcPool:
+        """Get the shared, concurrency-limited RPC pool for this adapter's endpoint"""
+        return get_rpc_pool(self.rpc_url)
+    
     def get_chain_type(self) -> ChainType:
         """Get the chain type for this adapter"""
         return self.chain_type
@@ -228,53 +326,88 @@ class ChainAdapterFactory:
     """Factory for creating chain adapters"""
     
     _adapters = {}
+    # Chain string ('sei', 'eth', 'sol') -> (ChainType, adapter class), so
+    # string lookups skip Enum coercion entirely
+    _by_string: Dict[str, tuple] = {}
+    # Built-in adapters, imported on first use so a process only pays for
+    # the chains (and the web3/service dependencies) it actually touches
+    _builtin: Dict[ChainType, tuple[str, str]] = {
+        ChainType.SEI: (".sei", "SEIAdapter"),
+        ChainType.ETHEREUM: (".eth", "EthereumAdapter"),
+        ChainType.SOLANA: (".sol", "SolanaAdapter"),
+    }
     
     @classmethod
     def register_adapter(cls, chain_type: ChainType, adapter_class: type):
         """Register a chain adapter class"""
         cls._adapters[chain_type] = adapter_class
+        cls._by_string[chain_type.value] = (chain_type, adapter_class)
     
     @classmethod
-    def create_adapter(cls, chain_type: ChainType, rpc_url: str) -> Optional[ChainAdapter]:
+    def get_adapter(cls, chain_type: ChainType) -> Optional[type]:
+        """Get the adapter class for ``chain_type``, importing it on first use"""
+        adapter_class = cls._adapters.get(chain_type)
+        if adapter_class is None and chain_type in cls._builtin:
+            module_name, class_name = cls._builtin[chain_type]
+            module = importlib.import_module(module_name, __package__)
+            adapter_class = getattr(module, class_name)
+            cls.register_adapter(chain_type, adapter_class)
+        return adapter_class
+    
+    @classmethod
+    def create_adapter(
+        cls, chain_type: ChainType, rpc_url: str, redis_client=None
+    ) -> Optional[ChainAdapter]:
         """
         Create a chain adapter instance
         
         Args:
             chain_type: Type of blockchain
             rpc_url: RPC URL for the blockchain
+            redis_client: Optional async Redis client for cross-process caching
             
         Returns:
             ChainAdapter instance or None if not supported
         """
-        adapter_class = cls._adapters.get(chain_type)
+        adapter_class = cls.get_adapter(chain_type)
         if adapter_class is None:
             return None
         
-        return adapter_class(chain_type, rpc_url)
+        return adapter_class(chain_type, rpc_url, redis_client=redis_client)
     
     @classmethod
     def get_supported_chains(cls) -> List[ChainType]:
         """Get list of supported chain types"""
-        return list(cls._adapters.keys())
+        return list(dict.fromkeys([*cls._builtin, *cls._adapters]))
 
 
 # Convenience functions
-def get_chain_adapter(chain_type: str, rpc_url: str) -> Optional[ChainAdapter]:
+def get_chain_adapter(chain_type: str, rpc_url: str, redis_client=None) -> Optional[ChainAdapter]:
     """
     Get a chain adapter by type string
     
     Args:
         chain_type: Chain type string ('sei', 'eth', 'sol')
         rpc_url: RPC URL for the blockchain
+        redis_client: Optional async Redis client for cross-process caching
         
     Returns:
         ChainAdapter instance or None if not supported
     """
-    try:
-        chain_enum = ChainType(chain_type.lower())
-        return ChainAdapterFactory.create_adapter(chain_enum, rpc_url)
-    except ValueError:
-        return None
+    entry = ChainAdapterFactory._by_string.get(chain_type)
+    if entry is None:
+        # Slow path: non-canonical casing (e.g. 'ETH') or not imported yet
+        try:
+            chain_enum = ChainType(chain_type.lower())
+        except ValueError:
+            return None
+        adapter_class = ChainAdapterFactory.get_adapter(chain_enum)
+        if adapter_class is None:
+            return None
+        entry = (chain_enum, adapter_class)
+    
+    chain_enum, adapter_class = entry
+    return adapter_class(chain_enum, rpc_url, redis_client=redis_client)
 
 
 def get_supported_chains() -> List[str]:
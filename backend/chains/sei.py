@@ -4,28 +4,101 @@ Implements the ChainAdapter interface for SEI blockchain
 """
 
 import os
+import re
 import time
 import asyncio
 from typing import Dict, List, Any, Optional
-from web3 import Web3
 import logging
 
 from .base import (
     ChainAdapter, ChainType, WalletProfile, StakingMetrics, 
-    GovernanceMetrics, ProtocolInteraction, TokenBalance
+    GovernanceMetrics, ProtocolInteraction, TokenBalance, async_ttl_cache
 )
-from ..services.sei_staking import SEIStakingService
-from ..services.sei_governance import SEIGovernanceService
-from ..credit_scorer import DeFiCreditScorer
-from ..coin_balance import get_wallet_balance
+from ..rpc_client import batch_rpc, rpc
 
 logger = logging.getLogger(__name__)
 
+# Per-address results are reused for this many seconds across adapter calls
+ADAPTER_CACHE_TTL = float(os.getenv("SEI_ADAPTER_CACHE_TTL", "30"))
+
+# SEI EVM addresses are Ethereum-style: 0x followed by 40 hex characters
+_ADDR_RE = re.compile(r"0x[0-9a-fA-F]{40}")
+
+# JSON-RPC calls behind a wallet profile, and how many addresses' worth of
+# them to pack into one batch request for bulk lookups
+PROFILE_RPC_METHODS = ("eth_getBalance", "eth_getTransactionCount", "eth_getCode")
+PROFILE_BATCH_SIZE = int(os.getenv("SEI_PROFILE_BATCH_SIZE", "50"))
+# Each profile's extras run a full credit score (log scans included), so
+# bulk lookups compute at most this many at once
+PROFILE_CONCURRENCY = int(os.getenv("SEI_PROFILE_CONCURRENCY", "8"))
+
+# Placeholder hash / counterparty for mock transaction history
+MOCK_TX_HASH = "0x" + "a" * 64
+MOCK_TX_TO = "0x" + "b" * 40
+
+# Mock protocol interactions as (name, type, volume USD, count, days since
+# last interaction, risk level); timestamps are materialised per call
+_SEI_INTERACTIONS: tuple[tuple, ...] = (
+    ("YEI Lending", "lending", 1000.0, 5, 7, "low"),
+    ("SEI DEX", "dex", 500.0, 3, 3, "medium"),
+)
+
+# Mock ERC-20 balances are static, so build them once at import
+_SEI_TOKEN_TEMPLATE: tuple[TokenBalance, ...] = (
+    # Mock USDC balance
+    TokenBalance(
+        token_address="0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48",
+        token_symbol="USDC",
+        balance_raw="1000000000",  # 1000 USDC
+        balance_formatted=1000.0,
+        value_usd=1000.0,
+        price_usd=1.0,
+        is_stablecoin=True,
+        is_bluechip=True
+    ),
+)
+
+# Neutral metrics returned (uncached) when the staking / governance lookup fails
+_NO_STAKING = StakingMetrics(
+    total_staked=0.0,
+    staking_duration_days=0,
+    rewards_earned=0.0,
+    penalties_incurred=0.0,
+    validator_count=0,
+    is_active_staker=False,
+    staking_score=0.0
+)
+_NO_GOVERNANCE = GovernanceMetrics(
+    total_votes_cast=0,
+    proposals_participated=0,
+    recent_votes_90d=0,
+    voting_power_used=0.0,
+    participation_rate=0.0,
+    is_active_voter=False,
+    governance_score=0.0
+)
+
+
+def _profile_calls(address: str) -> List[tuple]:
+    """JSON-RPC (method, params) pairs for one address's profile"""
+    return [(method, [address, "latest"]) for method in PROFILE_RPC_METHODS]
+
+
+def _has_valid_checksum(address: str) -> bool:
+    """Check a mixed-case address against its (memoised) EIP-55 checksum"""
+    # Imported here so web3 loads only once an address needs checking
+    from ..coin_balance import checksum_address
+    return checksum_address(address) == address
+
+
 class SEIAdapter(ChainAdapter):
     """SEI blockchain adapter implementation"""
     
-    def __init__(self, chain_type: ChainType, rpc_url: str):
-        super().__init__(chain_type, rpc_url)
+    # rpc_url -> (web3, staking service, governance service, credit scorer)
+    _shared: Dict[str, tuple] = {}
+    
+    def __init__(self, chain_type: ChainType, rpc_url: str, redis_client=None):
+        super().__init__(chain_type, rpc_url, redis_client)
         self.w3 = None
         self.staking_service = None
         self.governance_service = None
@@ -39,20 +112,35 @@ class SEIAdapter(ChainAdapter):
     async def connect(self) -> bool:
         """Connect to SEI RPC"""
         try:
-            self.w3 = Web3(Web3.HTTPProvider(self.rpc_url))
-            if not self.w3.is_connected():
-                raise ConnectionError(f"Cannot connect to SEI RPC: {self.rpc_url}")
-            
-            # Initialize services
-            self.staking_service = SEIStakingService()
-            self.governance_service = SEIGovernanceService()
-            
-            # Initialize credit scorer
-            self.credit_scorer = DeFiCreditScorer(
-                lending_pool_addr="0xA1b2C3d4E5f678901234567890abcdef12345678",
-                abi_path="yei-pool.json",
-                rpc_url=self.rpc_url,
-            )
+            # web3, the services and the credit scorer are heavy to import;
+            # defer them until an SEI adapter is actually used
+            from web3 import Web3
+            from ..services.sei_staking import SEIStakingService
+            from ..services.sei_governance import SEIGovernanceService
+            from ..credit_scorer import DeFiCreditScorer
+            
+            # Services and the credit scorer load ABIs and open web3 clients,
+            # so build them once per RPC URL and share them across adapters.
+            # Construction is synchronous, so there is no await between the
+            # check and the store for another coroutine to slip into.
+            shared = SEIAdapter._shared.get(self.rpc_url)
+            if shared is None:
+                w3 = Web3(Web3.HTTPProvider(self.rpc_url))
+                if not w3.is_connected():
+                    raise ConnectionError(f"Cannot connect to SEI RPC: {self.rpc_url}")
+                
+                shared = SEIAdapter._shared[self.rpc_url] = (
+                    w3,
+                    SEIStakingService(),
+                    SEIGovernanceService(),
+                    DeFiCreditScorer(
+                        lending_pool_addr="0xA1b2C3d4E5f678901234567890abcdef12345678",
+                        abi_path="yei-pool.json",
+                        rpc_url=self.rpc_url,
+                    ),
+                )
+            
+            self.w3, self.staking_service, self.governance_service, self.credit_scorer = shared
             
             self.is_connected = True
             logger.info(f"Connected to SEI RPC: {self.rpc_url}")
@@ -65,141 +153,137 @@ class SEIAdapter(ChainAdapter):
     
     def validate_address(self, address: str) -> bool:
         """Validate SEI wallet address format"""
-        try:
-            # SEI uses Ethereum-style addresses
-            if not address.startswith("0x"):
-                return False
-            
-            # Check length
-            if len(address) != 42:
-                return False
-            
-            # Validate checksum
-            Web3.to_checksum_address(address)
-            return True
-            
-        except Exception:
+        # fullmatch: "$" would also accept a trailing newline
+        if not isinstance(address, str) or not _ADDR_RE.fullmatch(address):
             return False
+        
+        # All-lower or all-upper addresses carry no checksum to verify
+        body = address[2:]
+        if body == body.lower() or body == body.upper():
+            return True
+        
+        return _has_valid_checksum(address)
     
+    # Errors fall back to the neutral profile, which is not cached
+    @async_ttl_cache(
+        ttl=ADAPTER_CACHE_TTL, fallback=lambda self, address: self._default_profile(address)
+    )
     async def get_wallet_profile(self, address: str) -> WalletProfile:
         """Get comprehensive SEI wallet profile"""
-        try:
-            if not self.is_connected:
-                await self.connect()
-            
-            # Validate address
-            if not self.validate_address(address):
-                raise ValueError(f"Invalid SEI address: {address}")
-            
-            # Get basic wallet data
-            balance_native = get_wallet_balance(address)
-            balance_usd = balance_native * 0.5  # Mock USD conversion
-            
-            # Get transaction count and history
-            transaction_count = await self._get_transaction_count(address)
-            first_tx_ts, last_tx_ts = await self._get_tx_timestamps(address)
-            unique_addresses = await self._get_unique_addresses(address)
-            
-            # Check if it's a contract
-            is_contract = await self._is_contract(address)
-            
-            # Get credit score for risk assessment
-            credit_result = await self.credit_scorer.calculate_async(address)
-            risk_score = 1.0 - (credit_result.score / 1000)  # Invert score to risk
-            confidence = credit_result.confidence
-            
-            return WalletProfile(
-                address=address,
-                chain=self.chain_type,
-                balance_native=balance_native,
-                balance_usd=balance_usd,
-                transaction_count=transaction_count,
-                first_tx_timestamp=first_tx_ts,
-                last_tx_timestamp=last_tx_ts,
-                unique_addresses=unique_addresses,
-                is_contract=is_contract,
-                risk_score=risk_score,
-                confidence=confidence
-            )
-            
-        except Exception as e:
-            logger.error(f"Error getting SEI wallet profile for {address}: {e}")
-            # Return default profile
-            return WalletProfile(
-                address=address,
-                chain=self.chain_type,
-                balance_native=0.0,
-                balance_usd=0.0,
-                transaction_count=0,
-                first_tx_timestamp=None,
-                last_tx_timestamp=None,
-                unique_addresses=0,
-                is_contract=False,
-                risk_score=0.5,
-                confidence=0.5
+        if not self.is_connected:
+            await self.connect()
+        
+        # Validate address
+        if not self.validate_address(address):
+            raise ValueError(f"Invalid SEI address: {address}")
+        
+        # Balance, nonce and code go out as one JSON-RPC batch; the
+        # history lookups and credit score run alongside it
+        rpc_result, extras = await asyncio.gather(
+            batch_rpc(_profile_calls(address), self.rpc_url),
+            self._profile_extras(address),
+            return_exceptions=True,
+        )
+        if isinstance(rpc_result, Exception):
+            logger.warning(f"RPC batch failed for {address}: {rpc_result}")
+            rpc_result = [None] * len(PROFILE_RPC_METHODS)
+        if isinstance(extras, Exception):
+            raise extras
+        
+        return self._build_profile(address, rpc_result, extras)
+    
+    async def get_wallet_profiles(self, addresses: List[str]) -> List[WalletProfile]:
+        """
+        Get SEI wallet profiles for many addresses at once
+        
+        Balance, nonce and code lookups for every address are packed into
+        JSON-RPC batches of up to ``PROFILE_BATCH_SIZE`` addresses each,
+        instead of one HTTP request per address. History lookups and credit
+        scores run at most ``PROFILE_CONCURRENCY`` addresses at a time.
+        
+        Args:
+            addresses: Wallet addresses to profile
+            
+        Returns:
+            One WalletProfile per input address, in order
+        """
+        if not self.is_connected:
+            await self.connect()
+        
+        valid = [a for a in addresses if self.validate_address(a)]
+        calls = [call for address in valid for call in _profile_calls(address)]
+        step = PROFILE_BATCH_SIZE * len(PROFILE_RPC_METHODS)
+        chunks = [calls[i:i + step] for i in range(0, len(calls), step)]
+        sem = asyncio.Semaphore(PROFILE_CONCURRENCY)
+        
+        async def extras_for(address: str) -> tuple:
+            async with sem:
+                return await self._profile_extras(address)
+        
+        results = await asyncio.gather(
+            *[batch_rpc(chunk, self.rpc_url) for chunk in chunks],
+            *[extras_for(address) for address in valid],
+            return_exceptions=True,
+        )
+        batches, extras = results[:len(chunks)], results[len(chunks):]
+        
+        # Flatten the batch replies back into per-call results
+        flat: List[Any] = []
+        for chunk, batch in zip(chunks, batches):
+            if isinstance(batch, Exception):
+                logger.warning(f"RPC batch of {len(chunk)} calls failed: {batch}")
+                batch = [None] * len(chunk)
+            flat.extend(batch)
+        
+        width = len(PROFILE_RPC_METHODS)
+        profiles = {}
+        for i, address in enumerate(valid):
+            if isinstance(extras[i], Exception):
+                logger.error(f"Error getting SEI wallet profile for {address}: {extras[i]}")
+                continue
+            profiles[address] = self._build_profile(
+                address, flat[i * width:(i + 1) * width], extras[i]
             )
+        
+        return [profiles.get(address) or self._default_profile(address) for address in addresses]
     
+    @async_ttl_cache(ttl=ADAPTER_CACHE_TTL, fallback=lambda self, address: _NO_STAKING)
     async def get_staking_metrics(self, address: str) -> StakingMetrics:
         """Get SEI staking metrics"""
-        try:
-            if not self.is_connected:
-                await self.connect()
-            
-            # Get staking data from service
-            staking_data = await self.staking_service.get_staking_metrics(address)
-            
-            return StakingMetrics(
-                total_staked=staking_data.bonded_amount,
-                staking_duration_days=staking_data.staking_duration_days,
-                rewards_earned=staking_data.total_rewards,
-                penalties_incurred=staking_data.slashing_penalties,
-                validator_count=staking_data.delegation_count,
-                is_active_staker=staking_data.is_active_staker,
-                staking_score=staking_data.bonded_amount / 1000.0  # Normalize to 0-1
-            )
-            
-        except Exception as e:
-            logger.error(f"Error getting SEI staking metrics for {address}: {e}")
-            return StakingMetrics(
-                total_staked=0.0,
-                staking_duration_days=0,
-                rewards_earned=0.0,
-                penalties_incurred=0.0,
-                validator_count=0,
-                is_active_staker=False,
-                staking_score=0.0
-            )
+        if not self.is_connected:
+            await self.connect()
+        
+        # Get staking data from service
+        staking_data = await self.staking_service.get_staking_metrics(address)
+        
+        return StakingMetrics(
+            total_staked=staking_data.bonded_amount,
+            staking_duration_days=staking_data.staking_duration_days,
+            rewards_earned=staking_data.total_rewards,
+            penalties_incurred=staking_data.slashing_penalties,
+            validator_count=staking_data.delegation_count,
+            is_active_staker=staking_data.is_active_staker,
+            staking_score=staking_data.bonded_amount / 1000.0  # Normalize to 0-1
+        )
     
+    @async_ttl_cache(ttl=ADAPTER_CACHE_TTL, fallback=lambda self, address: _NO_GOVERNANCE)
     async def get_governance_metrics(self, address: str) -> GovernanceMetrics:
         """Get SEI governance metrics"""
-        try:
-            if not self.is_connected:
-                await self.connect()
-            
-            # Get governance data from service
-            governance_data = await self.governance_service.get_governance_metrics(address)
-            
-            return GovernanceMetrics(
-                total_votes_cast=governance_data.total_votes_cast,
-                proposals_participated=governance_data.proposals_participated,
-                recent_votes_90d=governance_data.recent_votes_90d,
-                voting_power_used=governance_data.voting_power_used,
-                participation_rate=governance_data.participation_rate,
-                is_active_voter=governance_data.is_active_voter,
-                governance_score=governance_data.governance_score / 100.0  # Normalize to 0-1
-            )
-            
-        except Exception as e:
-            logger.error(f"Error getting SEI governance metrics for {address}: {e}")
-            return GovernanceMetrics(
-                total_votes_cast=0,
-                proposals_participated=0,
-                recent_votes_90d=0,
-                voting_power_used=0.0,
-                participation_rate=0.0,
-                is_active_voter=False,
-                governance_score=0.0
-            )
+        if not self.is_connected:
+            await self.connect()
+        
+        # Get governance data from service
+        governance_data = await self.governance_service.get_governance_metrics(address)
+        
+        return GovernanceMetrics(
+            total_votes_cast=governance_data.total_votes_cast,
+            proposals_participated=governance_data.proposals_participated,
+            recent_votes_90d=governance_data.recent_votes_90d,
+            voting_power_used=governance_data.voting_power_used,
+            participation_rate=governance_data.participation_rate,
+            is_active_voter=governance_data.is_active_voter,
+            governance_score=governance_data.governance_score / 100.0  # Normalize to 0-1
+        )
     
     async def get_protocol_interactions(self, address: str) -> List[ProtocolInteraction]:
         """Get SEI protocol interactions"""
@@ -209,29 +293,11 @@ class SEIAdapter(ChainAdapter):
             
             # For now, return mock data
             # In production, this would query protocol events and interactions
-            interactions = []
-            
-            # Mock lending protocol interaction
-            interactions.append(ProtocolInteraction(
-                protocol_name="YEI Lending",
-                protocol_type="lending",
-                total_volume_usd=1000.0,
-                interaction_count=5,
-                last_interaction_timestamp=int(time.time()) - 86400 * 7,  # 7 days ago
-                risk_level="low"
-            ))
-            
-            # Mock DEX interaction
-            interactions.append(ProtocolInteraction(
-                protocol_name="SEI DEX",
-                protocol_type="dex",
-                total_volume_usd=500.0,
-                interaction_count=3,
-                last_interaction_timestamp=int(time.time()) - 86400 * 3,  # 3 days ago
-                risk_level="medium"
-            ))
-            
-            return interactions
+            now = int(time.time())
+            return [
+                ProtocolInteraction(name, kind, volume, count, now - 86400 * days_ago, risk)
+                for name, kind, volume, count, days_ago, risk in _SEI_INTERACTIONS
+            ]
             
         except Exception as e:
             logger.error(f"Error getting SEI protocol interactions for {address}: {e}")
@@ -245,12 +311,14 @@ class SEIAdapter(ChainAdapter):
             
             balances = []
             
-            # Native SEI balance
-            native_balance = get_wallet_balance(address)
+            # Native SEI balance; keep the exact wei amount for balance_raw
+            balance_hex = await rpc("eth_getBalance", [address, "latest"], self.rpc_url)
+            balance_wei = int(balance_hex, 16) if balance_hex else 0
+            native_balance = balance_wei / 10**18
             balances.append(TokenBalance(
                 token_address="0x0000000000000000000000000000000000000000",
                 token_symbol="SEI",
-                balance_raw=str(int(native_balance * 1e18)),
+                balance_raw=str(balance_wei),
                 balance_formatted=native_balance,
                 value_usd=native_balance * 0.5,  # Mock USD price
                 price_usd=0.5,
@@ -258,17 +326,8 @@ class SEIAdapter(ChainAdapter):
                 is_bluechip=True
             ))
             
-            # Mock USDC balance
-            balances.append(TokenBalance(
-                token_address="0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48",
-                token_symbol="USDC",
-                balance_raw="1000000000",  # 1000 USDC
-                balance_formatted=1000.0,
-                value_usd=1000.0,
-                price_usd=1.0,
-                is_stablecoin=True,
-                is_bluechip=True
-            ))
+            # Mock token balances are static; only the native entry is live
+            balances.extend(_SEI_TOKEN_TEMPLATE)
             
             return balances
             
@@ -284,22 +343,21 @@ class SEIAdapter(ChainAdapter):
             
             # For now, return mock data
             # In production, this would query the SEI explorer API
-            transactions = []
-            
-            for i in range(min(limit, 10)):
-                transactions.append({
-                    'hash': f"0x{'a' * 64}",
+            now = int(time.time())
+            return [
+                {
+                    'hash': MOCK_TX_HASH,
                     'block_number': 1000000 + i,
-                    'timestamp': int(time.time()) - 86400 * i,
+                    'timestamp': now - 86400 * i,
                     'from': address,
-                    'to': f"0x{'b' * 40}",
+                    'to': MOCK_TX_TO,
                     'value': "1000000000000000000",  # 1 SEI
                     'gas_used': 21000,
                     'gas_price': "20000000000",
                     'status': 1
-                })
-            
-            return transactions
+                }
+                for i in range(min(limit, 10))
+            ]
             
         except Exception as e:
             logger.error(f"Error getting SEI transaction history for {address}: {e}")
@@ -311,12 +369,12 @@ class SEIAdapter(ChainAdapter):
             if not self.is_connected:
                 await self.connect()
             
-            # Get credit score using existing scorer
-            credit_result = await self.credit_scorer.calculate_async(address)
-            
-            # Get additional metrics
-            staking_metrics = await self.get_staking_metrics(address)
-            governance_metrics = await self.get_governance_metrics(address)
+            # Credit score and the additional metrics are independent
+            credit_result, staking_metrics, governance_metrics = await asyncio.gather(
+                self.credit_scorer.calculate_async(address),
+                self.get_staking_metrics(address),
+                self.get_governance_metrics(address),
+            )
             
             return {
                 'score': credit_result.score,
@@ -346,26 +404,78 @@ class SEIAdapter(ChainAdapter):
                 'governance_metrics': {}
             }
     
-    async def _get_transaction_count(self, address: str) -> int:
-        """Get transaction count for address"""
-        try:
-            # Mock implementation - in production would query explorer API
-            return 50
-        except Exception as e:
-            logger.error(f"Error getting transaction count: {e}")
-            return 0
+    async def _profile_extras(self, address: str) -> tuple:
+        """Fetch the non-RPC profile inputs: timestamps, counterparties, credit score"""
+        timestamps, unique_addresses, credit_result = await asyncio.gather(
+            self._get_tx_timestamps(address),
+            self._get_unique_addresses(address),
+            self.credit_scorer.calculate_async(address),
+            return_exceptions=True,
+        )
+        if isinstance(timestamps, Exception):
+            logger.warning(f"Timestamp lookup failed for {address}: {timestamps}")
+            timestamps = (None, None)
+        if isinstance(unique_addresses, Exception):
+            logger.warning(f"Unique address lookup failed for {address}: {unique_addresses}")
+            unique_addresses = 0
+        if isinstance(credit_result, Exception):
+            logger.warning(f"Credit score failed for {address}: {credit_result}")
+            credit_result = None
+        return timestamps, unique_addresses, credit_result
+    
+    def _build_profile(self, address: str, rpc_result: List[Any], extras: tuple) -> WalletProfile:
+        """Assemble a WalletProfile from the profile RPC results and extras"""
+        balance_hex, nonce_hex, code = rpc_result
+        (first_tx_ts, last_tx_ts), unique_addresses, credit_result = extras
+        
+        balance_native = int(balance_hex, 16) / 10**18 if balance_hex else 0.0
+        
+        # Invert credit score to risk; fall back to neutral when scoring failed
+        if credit_result is not None:
+            risk_score = 1.0 - (credit_result.score / 1000)
+            confidence = credit_result.confidence
+        else:
+            risk_score = 0.5
+            confidence = 0.5
+        
+        return WalletProfile(
+            address=address,
+            chain=self.chain_type,
+            balance_native=balance_native,
+            balance_usd=balance_native * 0.5,  # Mock USD conversion
+            transaction_count=int(nonce_hex, 16) if nonce_hex else 0,
+            first_tx_timestamp=first_tx_ts,
+            last_tx_timestamp=last_tx_ts,
+            unique_addresses=unique_addresses,
+            is_contract=bool(code) and code not in ("0x", "0x0"),
+            risk_score=risk_score,
+            confidence=confidence
+        )
     
+    def _default_profile(self, address: str) -> WalletProfile:
+        """Neutral profile returned when a wallet cannot be profiled"""
+        return WalletProfile(
+            address=address,
+            chain=self.chain_type,
+            balance_native=0.0,
+            balance_usd=0.0,
+            transaction_count=0,
+            first_tx_timestamp=None,
+            last_tx_timestamp=None,
+            unique_addresses=0,
+            is_contract=False,
+            risk_score=0.5,
+            confidence=0.5
+        )
+    
+    @async_ttl_cache(ttl=ADAPTER_CACHE_TTL, fallback=lambda self, address: (None, None))
     async def _get_tx_timestamps(self, address: str) -> tuple[Optional[int], Optional[int]]:
         """Get first and last transaction timestamps"""
-        try:
-            # Mock implementation
-            current_time = int(time.time())
-            first_tx = current_time - 86400 * 30  # 30 days ago
-            last_tx = current_time - 86400  # 1 day ago
-            return first_tx, last_tx
-        except Exception as e:
-            logger.error(f"Error getting transaction timestamps: {e}")
-            return None, None
+        # Mock implementation
+        current_time = int(time.time())
+        first_tx = current_time - 86400 * 30  # 30 days ago
+        last_tx = current_time - 86400  # 1 day ago
+        return first_tx, last_tx
     
     async def _get_unique_addresses(self, address: str) -> int:
         """Get number of unique addresses interacted with"""
@@ -375,20 +485,3 @@ class SEIAdapter(ChainAdapter):
         except Exception as e:
             logger.error(f"Error getting unique addresses: {e}")
             return 0
-    
-    async def _is_contract(self, address: str) -> bool:
-        """Check if address is a contract"""
-        try:
-            if not self.w3:
-                return False
-            
-            code = self.w3.eth.get_code(address)
-            return code != b''
-        except Exception as e:
-            logger.error(f"Error checking if address is contract: {e}")
-            return False
-
-
-# Register the SEI adapter with the factory
-from .base import ChainAdapterFactory
-ChainAdapterFactory.register_adapter(ChainType.SEI, SEIAdapter)
@@ -4,8 +4,10 @@ Implements the ChainAdapter interface for Solana blockchain
 """
 
 import os
+import re
 import time
 import asyncio
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 import logging
 
@@ -16,11 +18,83 @@ from .base import (
 
 logger = logging.getLogger(__name__)
 
+# Solana addresses are base58 encoded (no 0, O, I or l) and 32-44 characters long
+_B58_RE = re.compile(r"[1-9A-HJ-NP-Za-km-z]{32,44}")
+
+# Placeholder signature / counterparty for mock transaction history
+MOCK_TX_SIGNATURE = "A" * 64
+MOCK_TX_TO = "B" * 44
+
+# Mock protocol interactions as (name, type, volume USD, count, days since
+# last interaction, risk level); timestamps are materialised per call
+_SOL_INTERACTIONS: tuple[tuple, ...] = (
+    ("Raydium", "dex", 8001.0, 40, 1, "low"),
+    ("Orca", "dex", 3000.0, 15, 3, "low"),
+    ("Solend", "lending", 2500.0, 12, 7, "low"),
+    ("Marinade Finance", "staking", 5000.0, 8, 5, "low"),
+)
+
+# Mock balances are static, so build them once at import
+_SOL_BALANCE_TEMPLATE: tuple[TokenBalance, ...] = (
+    # SOL balance
+    TokenBalance(
+        token_address="So11111111111111111111111111111111111111112",
+        token_symbol="SOL",
+        balance_raw="25500000000",  # 25.5 SOL
+        balance_formatted=25.5,
+        value_usd=25.5 * 100,  # Mock SOL price
+        price_usd=100.0,
+        is_stablecoin=False,
+        is_bluechip=True
+    ),
+    # USDC balance
+    TokenBalance(
+        token_address="EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
+        token_symbol="USDC",
+        balance_raw="7500000000",  # 7500 USDC
+        balance_formatted=7500.0,
+        value_usd=7500.0,
+        price_usd=1.0,
+        is_stablecoin=True,
+        is_bluechip=True
+    ),
+    # USDT balance
+    TokenBalance(
+        token_address="Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB",
+        token_symbol="USDT",
+        balance_raw="4000000000",  # 4000 USDT
+        balance_formatted=4000.0,
+        value_usd=4000.0,
+        price_usd=1.0,
+        is_stablecoin=True,
+        is_bluechip=True
+    ),
+    # mSOL balance (Marinade staked SOL)
+    TokenBalance(
+        token_address="mSoLzYCxHdYgdzU16g5QSh3i5K3z3KZK7ytfqcJm7So",
+        token_symbol="mSOL",
+        balance_raw="15000000000",  # 15 mSOL
+        balance_formatted=15.0,
+        value_usd=15.0 * 100,
+        price_usd=100.0,
+        is_stablecoin=False,
+        is_bluechip=False
+    ),
+)
+
+
+@lru_cache(maxsize=4096)
+def _decodes_to_pubkey(address: str) -> bool:
+    """Check that a base58 address decodes to a 32-byte public key"""
+    import base58
+    return len(base58.b58decode(address)) == 32
+
+
 class SolanaAdapter(ChainAdapter):
     """Solana blockchain adapter implementation"""
     
-    def __init__(self, chain_type: ChainType, rpc_url: str):
-        super().__init__(chain_type, rpc_url)
+    def __init__(self, chain_type: ChainType, rpc_url: str, redis_client=None):
+        super().__init__(chain_type, rpc_url, redis_client)
         # In production, this would use solana-py library
         # from solana.rpc.api import Client
         # self.client = Client(rpc_url)
@@ -41,23 +115,18 @@ class SolanaAdapter(ChainAdapter):
             self.is_connected = False
             return False
     
-    def validate_address(self, address: str) -> bool:
-        """Validate Solana wallet address format"""
-        try:
-            # Solana addresses are base58 encoded and typically 32-44 characters
-            if len(address) < 32 or len(address) > 44:
-                return False
-            
-            # Check if it contains only base58 characters
-            import base58
-            try:
-                base58.b58decode(address)
-                return True
-            except Exception:
-                return False
-            
-        except Exception:
+    def validate_address(self, address: str, strict: bool = False) -> bool:
+        """
+        Validate Solana wallet address format
+        
+        Args:
+            address: Base58 wallet address
+            strict: Also decode the address and require a 32-byte public key
+        """
+        # fullmatch: "$" would also accept a trailing newline
+        if not isinstance(address, str) or not _B58_RE.fullmatch(address):
             return False
+        return _decodes_to_pubkey(address) if strict else True
     
     async def get_wallet_profile(self, address: str) -> WalletProfile:
         """Get comprehensive Solana wallet profile"""
@@ -184,49 +253,11 @@ class SolanaAdapter(ChainAdapter):
                 await self.connect()
             
             # Mock protocol interactions
-            interactions = []
-            
-            # Raydium interaction
-            interactions.append(ProtocolInteraction(
-                protocol_name="Raydium",
-                protocol_type="dex",
-                total_volume_usd=8001.0,
-                interaction_count=40,
-                last_interaction_timestamp=int(time.time()) - 86400 * 1,
-                risk_level="low"
-            ))
-            
-            # Orca interaction
-            interactions.append(ProtocolInteraction(
-                protocol_name="Orca",
-                protocol_type="dex",
-                total_volume_usd=3000.0,
-                interaction_count=15,
-                last_interaction_timestamp=int(time.time()) - 86400 * 3,
-                risk_level="low"
-            ))
-            
-            # Solend interaction
-            interactions.append(ProtocolInteraction(
-                protocol_name="Solend",
-                protocol_type="lending",
-                total_volume_usd=2500.0,
-                interaction_count=12,
-                last_interaction_timestamp=int(time.time()) - 86400 * 7,
-                risk_level="low"
-            ))
-            
-            # Marinade interaction
-            interactions.append(ProtocolInteraction(
-                protocol_name="Marinade Finance",
-                protocol_type="staking",
-                total_volume_usd=5000.0,
-                interaction_count=8,
-                last_interaction_timestamp=int(time.time()) - 86400 * 5,
-                risk_level="low"
-            ))
-            
-            return interactions
+            now = int(time.time())
+            return [
+                ProtocolInteraction(name, kind, volume, count, now - 86400 * days_ago, risk)
+                for name, kind, volume, count, days_ago, risk in _SOL_INTERACTIONS
+            ]
             
         except Exception as e:
             logger.error(f"Error getting Solana protocol interactions for {address}: {e}")
@@ -238,57 +269,8 @@ class SolanaAdapter(ChainAdapter):
             if not self.is_connected:
                 await self.connect()
             
-            balances = []
-            
-            # SOL balance
-            balances.append(TokenBalance(
-                token_address="So11111111111111111111111111111111111111112",
-                token_symbol="SOL",
-                balance_raw="25500000000",  # 25.5 SOL
-                balance_formatted=25.5,
-                value_usd=25.5 * 100,  # Mock SOL price
-                price_usd=100.0,
-                is_stablecoin=False,
-                is_bluechip=True
-            ))
-            
-            # USDC balance
-            balances.append(TokenBalance(
-                token_address="EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
-                token_symbol="USDC",
-                balance_raw="7500000000",  # 7500 USDC
-                balance_formatted=7500.0,
-                value_usd=7500.0,
-                price_usd=1.0,
-                is_stablecoin=True,
-                is_bluechip=True
-            ))
-            
-            # USDT balance
-            balances.append(TokenBalance(
-                token_address="Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB",
-                token_symbol="USDT",
-                balance_raw="4000000000",  # 4000 USDT
-                balance_formatted=4000.0,
-                value_usd=4000.0,
-                price_usd=1.0,
-                is_stablecoin=True,
-                is_bluechip=True
-            ))
-            
-            # mSOL balance (Marinade staked SOL)
-            balances.append(TokenBalance(
-                token_address="mSoLzYCxHdYgdzU16g5QSh3i5K3z3KZK7ytfqcJm7So",
-                token_symbol="mSOL",
-                balance_raw="15000000000",  # 15 mSOL
-                balance_formatted=15.0,
-                value_usd=15.0 * 100,
-                price_usd=100.0,
-                is_stablecoin=False,
-                is_bluechip=False
-            ))
-            
-            return balances
+            # Mock balances; in production this would query token accounts
+            return list(_SOL_BALANCE_TEMPLATE)
             
         except Exception as e:
             logger.error(f"Error getting Solana token balances for {address}: {e}")
@@ -302,21 +284,20 @@ class SolanaAdapter(ChainAdapter):
             
             # Mock transaction history
             # In production, this would query Solana RPC
-            transactions = []
-            
-            for i in range(min(limit, 25)):
-                transactions.append({
-                    'signature': f"{'A' * 64}",
+            now = int(time.time())
+            return [
+                {
+                    'signature': MOCK_TX_SIGNATURE,
                     'slot': 200000000 + i,
-                    'timestamp': int(time.time()) - 86400 * i,
+                    'timestamp': now - 86400 * i,
                     'from': address,
-                    'to': f"{'B' * 44}",
+                    'to': MOCK_TX_TO,
                     'amount': "1000000000",  # 1 SOL
                     'fee': "5000",
                     'status': "confirmed"
-                })
-            
-            return transactions
+                }
+                for i in range(min(limit, 25))
+            ]
             
         except Exception as e:
             logger.error(f"Error getting Solana transaction history for {address}: {e}")
@@ -369,8 +350,3 @@ class SolanaAdapter(ChainAdapter):
                 'staking_metrics': {},
                 'governance_metrics': {}
             }
-
-
-# Register the Solana adapter with the factory
-from .base import ChainAdapterFactory
-ChainAdapterFactory.register_adapter(ChainType.SOLANA, SolanaAdapter)
@@ -2,23 +2,80 @@
 import argparse
 import sys
 import os
+import threading
+from functools import lru_cache
+from typing import Optional
 
+import requests
 from web3 import Web3
 
+try:
+    from .rpc_client import json_dumps, json_loads
+except ImportError:
+    # Fallback for when running directly
+    from rpc_client import json_dumps, json_loads
+
 DEFAULT_RPC_URL = "https://evm-rpc.sei-apis.com"
 RPC_URL = os.getenv("SEI_RPC_URL", DEFAULT_RPC_URL)
+RPC_TIMEOUT = 10
+
+__all__ = ["get_wallet_balance", "get_wallet_balance_wei", "checksum_address"]
+
+# One Web3 client per process so every call reuses the same keep-alive session
+_SESSION = requests.Session()
+_SESSION.headers["Content-Type"] = "application/json"
+_W3: Optional[Web3] = None
+_W3_LOCK = threading.Lock()
+
+
+class _FastJsonHTTPProvider(Web3.HTTPProvider):
+    """HTTPProvider that (de)serialises JSON-RPC with orjson when available."""
+
+    def encode_rpc_request(self, method, params) -> bytes:
+        try:
+            return json_dumps({
+                "jsonrpc": "2.0",
+                "method": method,
+                "params": params or [],
+                "id": next(self.request_counter),
+            })
+        except TypeError:
+            # Params web3 knows how to encode but orjson doesn't (e.g. HexBytes)
+            return super().encode_rpc_request(method, params)
+
+    def decode_rpc_response(self, raw_response: bytes):
+        return json_loads(raw_response)
 
-__all__ = ["get_wallet_balance"]
+
+def _get_w3() -> Web3:
+    """Return the shared Web3 client, creating it on first use."""
+    global _W3
+    if _W3 is None:
+        with _W3_LOCK:
+            if _W3 is None:
+                _W3 = Web3(_FastJsonHTTPProvider(
+                    RPC_URL,
+                    request_kwargs={"timeout": RPC_TIMEOUT},
+                    session=_SESSION,
+                ))
+    return _W3
+
+
+@lru_cache(maxsize=4096)
+def checksum_address(wallet_address: str) -> str:
+    """EIP-55 checksum `wallet_address`, memoised since it costs a Keccak hash."""
+    return Web3.to_checksum_address(wallet_address)
+
+
+def get_wallet_balance_wei(wallet_address: str) -> int:
+    """Return the raw SEI balance (in wei) for `wallet_address`."""
+    return _get_w3().eth.get_balance(checksum_address(wallet_address))
 
 
 def get_wallet_balance(wallet_address: str) -> float:
     """Return the SEI balance (in native SEI) for `wallet_address`."""
-    w3 = Web3(Web3.HTTPProvider(RPC_URL))
-    if not w3.is_connected():
-        raise ConnectionError("Failed to connect to the Sei EVM RPC endpoint")
-
-    balance_wei = w3.eth.get_balance(Web3.to_checksum_address(wallet_address))
-    return w3.from_wei(balance_wei, "ether")
+    # Plain float maths; callers only ever compare/scale this as a float
+    return get_wallet_balance_wei(wallet_address) * 1e-18
 
 
 def _cli() -> None:
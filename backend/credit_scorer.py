@@ -12,23 +12,39 @@ from __future__ import annotations
 import datetime as _dt
 import os
 import json
+import random
+import re
 import time
 import asyncio
+import threading
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List, Set, Tuple, Optional
+from typing import Any, Callable, Dict, List, Set, Tuple, Optional
 from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from eth_utils import event_abi_to_log_topic
+from hexbytes import HexBytes
 from web3 import Web3
 
 try:
-    from .coin_balance import get_wallet_balance  # ← reuse working routine
+    from .coin_balance import checksum_address, get_wallet_balance  # ← reuse working routine
+    from .log_cache import LendingLogCache, get_log_cache
+    from .rpc_client import close_http_session, get_http_session, json_dumps, json_loads
     from .services.sei_staking import SEIStakingService, StakingMetrics
     from .services.sei_governance import SEIGovernanceService, GovernanceMetrics
 except ImportError:
     # Fallback for when running directly
-    from coin_balance import get_wallet_balance
+    from coin_balance import checksum_address, get_wallet_balance
+    from log_cache import LendingLogCache, get_log_cache
+    from rpc_client import close_http_session, get_http_session, json_dumps, json_loads
     from services.sei_staking import SEIStakingService, StakingMetrics
     from services.sei_governance import SEIGovernanceService, GovernanceMetrics
 
@@ -46,45 +62,150 @@ HEADERS = {"accept": "application/json"}
 
 MAX_BLOCK_RANGE = 1_000  # enforced by Sei RPC (reduced from 2000)
 
-# Cache for credit scores
-_CACHE: dict[str, tuple[float, dict]] = {}
+# Cache for credit scores, keyed by checksummed wallet. Holds the CreditScore
+# itself so a hit is returned as-is. Bounded so long-running servers don't
+# grow it without limit; the lock covers threaded callers.
+_CACHE: dict[str, tuple[float, CreditScore]] = {}
+_CACHE_LOCK = threading.RLock()
 CACHE_TTL = 300  # 5 minutes cache
+CACHE_MAXSIZE = 10_000
 
 
-def _get_cached(wallet: str) -> dict | None:
+def _get_cached(wallet: str) -> CreditScore | None:
     """Get cached credit score if still valid"""
-    item = _CACHE.get(wallet.lower())
+    with _CACHE_LOCK:
+        item = _CACHE.get(wallet)
     if not item:
         return None
     ts, data = item
     return data if time.time() - ts < CACHE_TTL else None
 
 
-def _set_cached(wallet: str, data: dict):
+def _set_cached(wallet: str, data: CreditScore):
     """Cache credit score with timestamp"""
-    _CACHE[wallet.lower()] = (time.time(), data)
+    now = time.time()
+    with _CACHE_LOCK:
+        if len(_CACHE) >= CACHE_MAXSIZE and wallet not in _CACHE:
+            # Drop expired entries first, then the oldest insertion
+            for key in [k for k, (ts, _) in _CACHE.items() if now - ts >= CACHE_TTL]:
+                del _CACHE[key]
+            if len(_CACHE) >= CACHE_MAXSIZE:
+                _CACHE.pop(next(iter(_CACHE)))
+        _CACHE[wallet] = (now, data)
+
+
+# Wallets whose lending scan found nothing, with the transaction count seen
+# at the time. Re-scanning is skipped for a day unless that count grows.
+_NO_LENDING: dict[str, tuple[float, int]] = {}
+NO_LENDING_TTL = 86_400  # 24 hours
+
+
+def _get_no_lending(wallet: str) -> int | None:
+    """Transaction count recorded when wallet last scanned with no lending events"""
+    with _CACHE_LOCK:
+        item = _NO_LENDING.get(wallet)
+    if not item:
+        return None
+    ts, tx_count = item
+    return tx_count if time.time() - ts < NO_LENDING_TTL else None
+
+
+def _set_no_lending(wallet: str, tx_count: int):
+    now = time.time()
+    with _CACHE_LOCK:
+        if len(_NO_LENDING) >= CACHE_MAXSIZE and wallet not in _NO_LENDING:
+            for key in [k for k, (ts, _) in _NO_LENDING.items() if now - ts >= NO_LENDING_TTL]:
+                del _NO_LENDING[key]
+            if len(_NO_LENDING) >= CACHE_MAXSIZE:
+                _NO_LENDING.pop(next(iter(_NO_LENDING)))
+        _NO_LENDING[wallet] = (now, tx_count)
+
+
+# Keep-alive session shared by every explorer and eth_getLogs call; urllib3
+# retries transient failures with exponential backoff instead of a hand-rolled
+# loop. pool_maxsize covers the eth_getLogs thread pool's concurrent posts so
+# connections are reused rather than discarded.
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+    ),
+)
+# Plain http too, for self-hosted RPC nodes
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+
+def _fetch_json(url: str, timeout: int = 30) -> Dict[str, Any]:
+    """Fetch JSON over the pooled session; {} on failure so scoring continues."""
+    try:
+        resp = _SESSION.get(url, timeout=timeout)
+        resp.raise_for_status()
+        return json_loads(resp.content)
+    except (requests.exceptions.RequestException, ValueError) as e:
+        print(f"API request failed: {e}")
+        return {}
+
 
+# Explorer retry backoff: exponential with full jitter, so concurrent scorers
+# hitting a rate limit together don't all retry in lockstep
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_CAP = 30.0
 
-def _fetch_json(url: str, retries: int = 3, timeout: int = 30) -> Dict[str, Any]:
-    """Fetch JSON with retry logic and better timeout handling."""
-    for attempt in range(retries):
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Seconds to wait before retry `attempt`; a numeric Retry-After wins."""
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), RETRY_BACKOFF_CAP)
+    return random.uniform(0, min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * 2 ** attempt))
+
+
+async def _afetch_json(url: str, timeout: int = 30, retries: int = 3) -> Dict[str, Any]:
+    """Async `_fetch_json` over the shared aiohttp session, same retry policy."""
+    for attempt in range(retries + 1):
         try:
-            resp = requests.get(url, headers=HEADERS, timeout=timeout)
-            resp.raise_for_status()
-            return resp.json()
-        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
-            if attempt < retries - 1:
-                wait_time = (attempt + 1) * 2  # Progressive backoff: 2s, 4s, 6s
-                print(f"API request failed (attempt {attempt + 1}/{retries}), retrying in {wait_time}s...")
-                time.sleep(wait_time)
+            async with get_http_session().get(
+                url,
+                headers=HEADERS,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            ) as resp:
+                if resp.status in (429, 500, 502, 503, 504) and attempt < retries:
+                    await asyncio.sleep(_retry_delay(attempt, resp.headers.get("Retry-After")))
+                    continue
+                resp.raise_for_status()
+                return json_loads(await resp.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            if attempt < retries:
+                await asyncio.sleep(_retry_delay(attempt))
                 continue
-            else:
-                print(f"API request failed after {retries} attempts: {e}")
-                # Return empty dict so the script can continue with default values
-                return {}
-        except requests.exceptions.RequestException as e:
-            print(f"API request error: {e}")
+            print(f"API request failed: {e}")
             return {}
+    return {}
+
+
+# Web3 clients per RPC URL, and their latest block number as (fetched_at,
+# block). Sei produces a block every ~0.4-2s, so a few seconds' staleness
+# only shifts the scan end by a handful of blocks.
+_WEB3_CLIENTS: Dict[str, Web3] = {}
+_LATEST_BLOCK_CACHE: Dict[str, Tuple[float, int]] = {}
+LATEST_BLOCK_TTL = 5
+
+
+def latest_block(w3: Web3) -> int:
+    """`w3.eth.block_number`, reused for LATEST_BLOCK_TTL seconds."""
+    key = w3.provider.endpoint_uri
+    now = time.monotonic()
+    item = _LATEST_BLOCK_CACHE.get(key)
+    if item is not None and now - item[0] < LATEST_BLOCK_TTL:
+        return item[1]
+    block = w3.eth.block_number
+    _LATEST_BLOCK_CACHE[key] = (now, block)
+    return block
 
 
 # --------------------------------------------------------------------------- #
@@ -99,20 +220,45 @@ class SeiProvider:
     @classmethod
     def connect(cls, rpc: Optional[str] = None) -> "SeiProvider":
         rpc_url = rpc or os.getenv("SEI_RPC_URL", DEFAULT_RPC_URL)
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
-        if not w3.is_connected():
-            raise ConnectionError(f"Cannot reach Sei RPC at {rpc_url}")
+        w3 = _WEB3_CLIENTS.get(rpc_url)
+        if w3 is None:
+            # One pooled keep-alive client per endpoint, shared by every scorer
+            w3 = Web3(Web3.HTTPProvider(
+                rpc_url, session=_SESSION, request_kwargs={"timeout": 30}
+            ))
+            if not w3.is_connected():
+                raise ConnectionError(f"Cannot reach Sei RPC at {rpc_url}")
+            _WEB3_CLIENTS[rpc_url] = w3
         return cls(w3=w3, rpc_url=rpc_url)
 
     # -------- wallet metadata -------------------------------------------- #
 
-    def first_tx_info(self, wallet: str) -> Tuple[_dt.datetime | None, int | None]:
+    def first_tx_info(self, wallet: str) -> Tuple[int | None, int | None]:
         """
-        Returns (timestamp, block_number) of the wallet's very first tx.
+        Returns (unix timestamp, block_number) of the wallet's very first tx.
         If the wallet has no tx history or API fails, both return None.
         """
-        url = f"{EXPLORER}/{wallet}/transactions?limit=1&sort=asc"
-        data = _fetch_json(url)
+        return self._parse_first_tx(_fetch_json(self._first_tx_url(wallet)))
+
+    async def afirst_tx_info(self, wallet: str) -> Tuple[int | None, int | None]:
+        """Async `first_tx_info`."""
+        return self._parse_first_tx(await _afetch_json(self._first_tx_url(wallet)))
+
+    def counters(self, wallet: str) -> Dict[str, Any]:
+        data = _fetch_json(f"{EXPLORER}/{wallet}/counters")
+        return data if data else {"transaction_count": 0, "unique_addresses": []}
+
+    async def acounters(self, wallet: str) -> Dict[str, Any]:
+        """Async `counters`."""
+        data = await _afetch_json(f"{EXPLORER}/{wallet}/counters")
+        return data if data else {"transaction_count": 0, "unique_addresses": []}
+
+    @staticmethod
+    def _first_tx_url(wallet: str) -> str:
+        return f"{EXPLORER}/{wallet}/transactions?limit=1&sort=asc"
+
+    @staticmethod
+    def _parse_first_tx(data: Dict[str, Any]) -> Tuple[int | None, int | None]:
         items = data.get("items", []) if data else []
         if not items:
             return None, None
@@ -124,9 +270,9 @@ class SeiProvider:
 
             # timestamp can be "168…" or ISO "2025-07-15T…" – normalise
             if isinstance(ts_raw, (int, float)) or (isinstance(ts_raw, str) and ts_raw.isdigit()):
-                ts = _dt.datetime.fromtimestamp(int(ts_raw), _dt.timezone.utc)
+                ts = int(ts_raw)
             else:
-                ts = _dt.datetime.fromisoformat(ts_raw.replace("Z", "+00:00"))
+                ts = int(_dt.datetime.fromisoformat(ts_raw.replace("Z", "+00:00")).timestamp())
 
             blk = int(blk_raw) if blk_raw is not None else None
             return ts, blk
@@ -134,41 +280,245 @@ class SeiProvider:
             print(f"Error parsing transaction data: {e}")
             return None, None
 
-    def counters(self, wallet: str) -> Dict[str, Any]:
-        data = _fetch_json(f"{EXPLORER}/{wallet}/counters")
-        return data if data else {"transaction_count": 0, "unique_addresses": []}
-
 
 # --------------------------------------------------------------------------- #
 # 3.  Lending-pool event fetcher
 # --------------------------------------------------------------------------- #
 
+# Lending-pool events scored for repayment, as (label, ABI event name)
+LENDING_EVENTS = (
+    ("Borrow", "Borrow"),
+    ("Repay", "Repay"),
+    ("Liquidation", "LiquidationCall"),
+)
+
+# Block windows packed into one JSON-RPC batch; each window carries one
+# eth_getLogs per lending event
+LOG_WINDOWS_PER_BATCH = 4
+
+# Batches posted concurrently per round. Windows are independent, so several
+# batches in flight cut a long scan's wall time by about this factor; keep it
+# modest to stay inside the RPC's rate limits.
+LOG_BATCHES_IN_FLIGHT = int(os.getenv("SEI_LOG_BATCHES_IN_FLIGHT", "4"))
+
+# Upper bound for the adaptive log window. Empty windows double the range up
+# to this; a provider rejecting a range lowers it for the rest of the scan.
+MAX_LOG_WINDOW = int(os.getenv("SEI_MAX_LOG_WINDOW", "100000"))
+
+# eth_getLogs batches and single-call fallbacks (batch rejected or
+# unsupported) are independent and I/O-bound, so each round's requests run
+# concurrently on this pool
+_LOG_EXECUTOR = ThreadPoolExecutor(
+    max_workers=len(LENDING_EVENTS) * LOG_WINDOWS_PER_BATCH,
+    thread_name_prefix="eth-getlogs",
+)
+
+
+def _addr_topic(address: str) -> str:
+    """Left-pad an address to a 32-byte indexed-topic value."""
+    return "0x" + address[2:].lower().rjust(64, "0")
+
+
+# (label, event, topic0, user topic slot, user data word); see lending_event_specs
+LendingEventSpec = Tuple[str, Any, str, Optional[int], Optional[int]]
+
+# ABI types encoded in exactly one 32-byte head word
+_STATIC_WORD = re.compile(r"^(address|bool|u?int\d*|bytes([1-9]|[12]\d|3[0-2]))$")
+
+
+def lending_event_specs(contract) -> List[LendingEventSpec]:
+    """
+    Per-pool view of LENDING_EVENTS as
+    (label, event, topic0, user_position, user_word).
+
+    topic0 is the event signature hash and user_position the topic slot of
+    the indexed `user` input, or None when `user` is not indexed (e.g.
+    Borrow). For those, user_word is the 32-byte word of the log data that
+    holds `user`, so other wallets' logs can be dropped before decoding;
+    None if it is not at a fixed offset. Nothing here depends on the
+    wallet, so build this once per contract.
+    """
+    specs = []
+    for ev_name, abi_name in LENDING_EVENTS:
+        ev = getattr(contract.events, abi_name)()
+        topic0 = "0x" + event_abi_to_log_topic(ev.abi).hex()
+        indexed = [arg["name"] for arg in ev.abi["inputs"] if arg.get("indexed")]
+        position = indexed.index("user") + 1 if "user" in indexed else None
+        word = None
+        if position is None:
+            for i, arg in enumerate(a for a in ev.abi["inputs"] if not a.get("indexed")):
+                if arg["name"] == "user":
+                    word = i
+                    break
+                if not _STATIC_WORD.match(arg["type"]):
+                    break
+        specs.append((ev_name, ev, topic0, position, word))
+    return specs
+
+
+def _data_word_is(raw: Dict[str, Any], word: int, wallet: bytes) -> bool:
+    """True if address word `word` of the log's data equals `wallet`."""
+    data = HexBytes(raw["data"])
+    return data[32 * word + 12:32 * (word + 1)] == wallet
+
+
+def _user_topics(topic0: str, user_position: Optional[int], wallet: str) -> List[Optional[str]]:
+    """
+    eth_getLogs topic filter selecting `wallet` as the event's `user`.
+
+    Without an indexed `user` the node can only filter on topic0, so the
+    caller must match `args.user` after decoding.
+    """
+    if user_position is None:
+        return [topic0]
+    return [topic0] + [None] * (user_position - 1) + [_addr_topic(wallet)]
+
+
+def _normalise_log(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a raw JSON-RPC log like web3's formatted result for process_log."""
+    return {
+        **raw,
+        "topics": [HexBytes(t) for t in raw["topics"]],
+        "blockNumber": int(raw["blockNumber"], 16),
+        "blockHash": HexBytes(raw["blockHash"]),
+        "transactionHash": HexBytes(raw["transactionHash"]),
+        "transactionIndex": int(raw["transactionIndex"], 16),
+        "logIndex": int(raw["logIndex"], 16),
+    }
+
+
+def _check_deadline(deadline: Optional[float]) -> None:
+    if deadline is not None and time.monotonic() > deadline:
+        raise TimeoutError("Lending history scan timed out")
+
+
+def _get_logs_single(w3: Web3, params: Dict[str, Any], deadline: Optional[float] = None) -> List[Any]:
+    """Fetch one window with a plain eth_getLogs, retrying until it succeeds."""
+    while True:
+        _check_deadline(deadline)
+        try:
+            return list(w3.eth.get_logs(params))
+        except Exception as exc:
+            print(f"RPC error {params['fromBlock']}-{params['toBlock']}: {exc} – retry in 0.5 s")
+            time.sleep(0.5)
+
+
+def _post_log_batch(url: str, calls: List[Tuple[int, Dict[str, Any]]]) -> Dict[int, Any]:
+    """POST (id, params) eth_getLogs calls as one JSON-RPC batch; replies by id."""
+    payload = [
+        {"jsonrpc": "2.0", "id": n, "method": "eth_getLogs", "params": [params]}
+        for n, params in calls
+    ]
+    try:
+        resp = _SESSION.post(
+            url,
+            data=json_dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=30,
+        )
+        data = json_loads(resp.content) if resp.ok else None
+    except (requests.exceptions.RequestException, ValueError):
+        return {}
+    if not isinstance(data, list):
+        return {}
+    return {item.get("id"): item for item in data if isinstance(item, dict)}
+
+
 def batched_logs(
-    event,
+    w3: Web3,
+    address: str,
+    topic_filters: List[List[Optional[str]]],
     start: int,
     end: int,
-    **filters,
-) -> List[Any]:
-    """Fetch logs in provider-safe 2 000-block chunks with auto-retry."""
-    all_logs: List[Any] = []
+    deadline: Optional[float] = None,
+    keep: Optional[List[Optional[Callable[[Dict[str, Any]], bool]]]] = None,
+) -> List[List[Any]]:
+    """
+    Fetch logs for several topic filters over [start, end].
+
+    `keep` optionally holds one raw-log predicate per filter (None keeps
+    everything). It narrows results the topic filter cannot, e.g. to a
+    non-indexed `user`; only kept logs count as activity below.
+
+    Blocks are walked in windows that start at MAX_BLOCK_RANGE and double
+    after every round that keeps no logs (up to MAX_LOG_WINDOW), so long
+    quiet stretches cost O(log N) round trips. If the node rejects a widened
+    window, the window is halved and the same blocks are retried. That size
+    also becomes the new ceiling. Every filter for LOG_WINDOWS_PER_BATCH
+    consecutive windows goes out as one JSON-RPC batch, and each round posts
+    LOG_BATCHES_IN_FLIGHT such batches concurrently. Calls rejected at
+    MAX_BLOCK_RANGE (or providers without batch support) fall back to
+    single calls, issued concurrently.
+
+    `deadline` is a time.monotonic() value; TimeoutError is raised once it
+    passes, checked between round trips.
+
+    Returns one list of logs per entry in `topic_filters`.
+    """
+    url = w3.provider.endpoint_uri
+    results: List[List[Any]] = [[] for _ in topic_filters]
+    per_batch = len(topic_filters) * LOG_WINDOWS_PER_BATCH
+    window = MAX_BLOCK_RANGE
+    ceiling = max(MAX_BLOCK_RANGE, MAX_LOG_WINDOW)
     cur = start
+
     while cur <= end:
-        tgt = min(cur + MAX_BLOCK_RANGE - 1, end)
-        try:
-            logs = event.get_logs(
-                from_block=cur,
-                to_block=tgt,
-                argument_filters=filters,
-            )
-            all_logs.extend(logs)
+        _check_deadline(deadline)
+        windows = []
+        frm = cur
+        while frm <= end and len(windows) < LOG_WINDOWS_PER_BATCH * LOG_BATCHES_IN_FLIGHT:
+            tgt = min(frm + window - 1, end)
+            windows.append((frm, tgt))
+            frm = tgt + 1
+        calls = [
+            (q, frm, tgt, {
+                "fromBlock": hex(frm),
+                "toBlock": hex(tgt),
+                "address": address,
+                "topics": topics,
+            })
+            for frm, tgt in windows
+            for q, topics in enumerate(topic_filters)
+        ]
+        batches = [
+            [(n, calls[n][3]) for n in range(i, min(i + per_batch, len(calls)))]
+            for i in range(0, len(calls), per_batch)
+        ]
+        by_id: Dict[int, Any] = {}
+        for replies in _LOG_EXECUTOR.map(lambda batch: _post_log_batch(url, batch), batches):
+            by_id.update(replies)
+        ok = [
+            isinstance(by_id.get(n, {}).get("result"), list)
+            for n in range(len(calls))
+        ]
+
+        if window > MAX_BLOCK_RANGE and not all(ok):
+            # Range too wide for this provider: shrink and retry these blocks
+            window = ceiling = max(MAX_BLOCK_RANGE, window // 2)
+            continue
+
+        failed = [n for n in range(len(calls)) if not ok[n]]
+        fallback = dict(zip(failed, _LOG_EXECUTOR.map(
+            lambda n: _get_logs_single(w3, calls[n][3], deadline), failed
+        )))
+
+        found = 0
+        for n, (q, frm, tgt, params) in enumerate(calls):
+            if ok[n]:
+                logs = [_normalise_log(raw) for raw in by_id[n]["result"]]
+            else:
+                logs = fallback[n]
+            if keep and keep[q]:
+                logs = [raw for raw in logs if keep[q](raw)]
+            results[q].extend(logs)
+            found += len(logs)
             if logs:
-                print(f"   {len(logs):3d} logs {cur:>8d}-{tgt:<8d}")
-        except Exception as exc:
-            print(f"RPC error {cur}-{tgt}: {exc} – retry in 0.5 s")
-            time.sleep(0.5)
-            continue  # retry the same chunk
-        cur = tgt + 1
-    return all_logs
+                print(f"   {len(logs):3d} logs {frm:>8d}-{tgt:<8d}")
+
+        if not found:
+            window = min(window * 2, ceiling)
+        cur = windows[-1][1] + 1
+    return results
 
 
 def lending_history(
@@ -177,52 +527,78 @@ def lending_history(
     w3: Web3,
     start_block: int,
     timeout_seconds: int = 30,  # Add timeout parameter
+    events: Optional[List[LendingEventSpec]] = None,
+    log_cache: Optional[LendingLogCache] = None,
 ) -> List[Dict[str, Any]]:
-    """Chronological Borrow / Repay / Liquidation events for wallet."""
-    import signal
-    
-    latest = w3.eth.block_number
+    """
+    Chronological Borrow / Repay / Liquidation events for wallet.
+
+    `events` is the contract's lending_event_specs(); pass it in to skip
+    re-deriving the topic hashes on every call.
+
+    With a `log_cache` whose scanned range reaches start_block, only blocks
+    after that range are fetched and the cached events are reused; the new
+    blocks and events are recorded once the scan completes.
+    """
+    # A monotonic deadline checked between round trips works on any thread
+    # (SIGALRM only fires on the main thread, so never under worker pools)
+    deadline = time.monotonic() + timeout_seconds
+    latest = latest_block(w3)
     hist: List[Dict[str, Any]] = []
-    
-    # Set up timeout handler
-    def timeout_handler(signum, frame):
-        raise TimeoutError("Lending history scan timed out")
-    
-    # Set timeout (only works on Unix-like systems)
-    try:
-        signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(timeout_seconds)
-    except (AttributeError, OSError):
-        # Windows doesn't support SIGALRM, skip timeout
-        pass
 
-    try:
-        for ev_name, ev in [
-            ("Borrow", contract.events.Borrow()),
-            ("Repay", contract.events.Repay()),
-            ("Liquidation", contract.events.LiquidationCall()),
-        ]:
-            print(f"Scanning {ev_name} events…")
-            logs = batched_logs(ev, start_block, latest, user=wallet)
-            for lg in logs:
-                args = lg["args"]
-                hist.append(
-                    {
-                        "type": ev_name,
-                        "block": lg["blockNumber"],
-                        "tx": lg["transactionHash"].hex(),
-                        **{k: args[k] for k in args},
-                    }
-                )
-        hist.sort(key=lambda x: x["block"])
-    finally:
-        # Clear timeout
-        try:
-            signal.alarm(0)
-        except (AttributeError, OSError):
-            pass
-    
-    return hist
+    if events is None:
+        events = lending_event_specs(contract)
+
+    pool = contract.address
+    range_from, scan_from = start_block, start_block
+    cached: List[Dict[str, Any]] = []
+    covered = log_cache.scanned_range(pool, wallet) if log_cache else None
+    if covered and covered[0] <= start_block <= covered[1] + 1:
+        range_from, scan_from = covered[0], covered[1] + 1
+        cached = log_cache.events(pool, wallet, start_block)
+        if scan_from > latest:
+            return cached
+        print(f"   ➜ {len(cached)} cached lending events up to block {covered[1]}")
+
+    wallet_raw = bytes.fromhex(wallet[2:])
+    print("Scanning Borrow / Repay / Liquidation events…")
+    per_event = batched_logs(
+        w3,
+        pool,
+        [_user_topics(topic0, position, wallet) for _, _, topic0, position, _ in events],
+        scan_from,
+        latest,
+        deadline,
+        # `user` isn't a topic: match it in the raw data, so only the
+        # wallet's logs are decoded and count towards widening the window
+        keep=[
+            (lambda raw, word=word: _data_word_is(raw, word, wallet_raw))
+            if word is not None
+            else None
+            for _, _, _, _, word in events
+        ],
+    )
+    wallet_lc = wallet.lower()
+    for (ev_name, ev, _, position, _), logs in zip(events, per_event):
+        for raw in logs:
+            lg = ev.process_log(raw)
+            args = lg["args"]
+            if position is None and str(args.get("user", "")).lower() != wallet_lc:
+                continue
+            hist.append(
+                {
+                    "type": ev_name,
+                    "block": lg["blockNumber"],
+                    "tx": lg["transactionHash"].hex(),
+                    "logIndex": lg["logIndex"],
+                    **args,
+                }
+            )
+    hist.sort(key=itemgetter("block", "logIndex"))
+
+    if log_cache:
+        log_cache.record(pool, wallet, range_from, latest, hist)
+    return cached + hist
 
 
 # --------------------------------------------------------------------------- #
@@ -238,6 +614,47 @@ class CreditScore:
     confidence: float = 0.8  # Default confidence
 
 
+@lru_cache(maxsize=None)
+def _load_abi(abi_file: Path) -> list:
+    """Parse an ABI file once per process"""
+    with abi_file.open("r", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+@lru_cache(maxsize=32)
+def _lending_pool(w3: Web3, pool_addr: str, abi_file: Path):
+    """
+    Contract wrapper and lending_event_specs for a pool, built once per
+    (client, pool, ABI). Web3 clients are pooled per RPC url, so scorers
+    created per request share the same objects.
+    """
+    contract = w3.eth.contract(address=checksum_address(pool_addr), abi=_load_abi(abi_file))
+    return contract, lending_event_specs(contract)
+
+
+# Pillar ladders: a value strictly above TH[i] (and not above TH[i+1]) earns
+# SC[i+1]; at or below TH[0] earns SC[0]. bisect_left keeps the "> threshold"
+# boundaries of the original if/elif chains.
+_AGE_TH, _AGE_SC = (90, 365, 730), (-30, +20, +60, +100)
+_TX_TH, _TX_SC = (50, 300, 2_000), (-20, +20, +60, +100)
+_BAL_TH, _BAL_SC = (50, 500, 5_000), (-30, +20, +60, +100)
+_DEFI_TH, _DEFI_SC = (10, 25), (0, +10, +30)
+
+# Risk buckets: a final score at or above _RISK_TH[i] (and below _RISK_TH[i+1])
+# is _RISK_LABELS[i+1]; bisect_right keeps the ">=" boundaries
+_RISK_TH = (300, 500, 700, 850)
+_RISK_LABELS = ("Very High Risk", "High Risk", "Medium Risk", "Low Risk", "Very Low Risk")
+
+# Wallets scored at once by calculate_many; each one runs its own explorer,
+# RPC and log-scan requests, so keep this within the providers' rate limits
+SCORE_CONCURRENCY = int(os.getenv("CREDIT_SCORE_CONCURRENCY", "8"))
+
+
+def _tx_count(counters: Dict[str, Any]) -> int:
+    """Transaction count from a Blockscout counters reply (v2 says transactions_count)"""
+    return int(counters.get("transactions_count", counters.get("transaction_count")) or 0)
+
+
 class DeFiCreditScorer:
     BASE = 500
     AGE_W = 0.12
@@ -265,13 +682,18 @@ class DeFiCreditScorer:
         if not abi_file.exists():
             raise FileNotFoundError(f"Unable to locate lending pool ABI at {abi_file}")
 
-        with abi_file.open("r", encoding="utf-8") as fh:
-            abi = json.load(fh)
-        self.pool = self.provider.w3.eth.contract(
-            address=Web3.to_checksum_address(lending_pool_addr),
-            abi=abi,
+        self.pool, self.lending_events = _lending_pool(
+            self.provider.w3, lending_pool_addr, abi_file
         )
         
+        # Optional shared cache so scores survive restarts and are reused
+        # across worker processes
+        self.redis_client = redis_client
+
+        # Local SQLite store of scanned lending events, so repeat scores of a
+        # wallet only scan the blocks added since
+        self.log_cache = get_log_cache()
+
         # Initialize SEI services
         self.staking_service = SEIStakingService(redis_client=redis_client)
         self.governance_service = SEIGovernanceService(redis_client=redis_client)
@@ -283,35 +705,18 @@ class DeFiCreditScorer:
     def _score_age(self, days: int | None) -> int:
         if days is None:
             return -50
-        if days > 730:
-            return +100
-        if days > 365:
-            return +60
-        if days > 90:
-            return +20
-        return -30
+        return _AGE_SC[bisect_left(_AGE_TH, days)]
 
     def _score_transactions(self, txs: int) -> int:
-        if txs > 2_000:
-            return +100
-        if txs > 300:
-            return +60
-        if txs > 50:
-            return +20
-        return -20
+        return _TX_SC[bisect_left(_TX_TH, txs)]
 
     def _score_balances(self, sei_native: float) -> int:
-        if sei_native > 5_000:
-            return +100
-        if sei_native > 500:
-            return +60
-        if sei_native > 50:
-            return +20
-        return -30
+        return _BAL_SC[bisect_left(_BAL_TH, sei_native)]
 
     def _score_repayment(self, events: List[Dict[str, Any]]) -> int:
-        borrows = len([e for e in events if e["type"] == "Borrow"])
-        liquid = len([e for e in events if e["type"] == "Liquidation"])
+        counts = Counter(e["type"] for e in events)
+        borrows = counts["Borrow"]
+        liquid = counts["Liquidation"]
         if borrows == 0:
             return 0
         ratio = liquid / borrows
@@ -324,11 +729,7 @@ class DeFiCreditScorer:
         return int(-150 * ratio)
 
     def _score_defi_extras(self, contracts_touched: int) -> int:
-        if contracts_touched > 25:
-            return +30
-        if contracts_touched > 10:
-            return +10
-        return 0
+        return _DEFI_SC[bisect_left(_DEFI_TH, contracts_touched)]
 
     def _score_staking(self, metrics: StakingMetrics) -> int:
         """Score staking activity and tenure using real metrics"""
@@ -390,79 +791,142 @@ class DeFiCreditScorer:
             confidence += 0.1
         elif days_old > 90:
             confidence += 0.05
+
+        # Factor 3: scored without a lending history scan
+        if not user_data.get('lending_scanned', True):
+            confidence -= 0.2
             
         return min(1.0, confidence)
 
+    # ---------- shared (Redis) score cache ------------------------------ #
+
+    async def _get_shared_cached(self, wallet: str) -> CreditScore | None:
+        """Read a score another process cached; warms the local cache too"""
+        if not self.redis_client:
+            return None
+        try:
+            cached = await self.redis_client.get(f"credit_scorer:{wallet}")
+        except Exception as e:
+            print(f"Cache error: {e}")
+            return None
+        if not cached:
+            return None
+        result = CreditScore(**json.loads(cached))
+        _set_cached(wallet, result)
+        return result
+
+    async def _set_shared_cached(self, wallet: str, result: CreditScore) -> None:
+        if not self.redis_client:
+            return
+        data = {
+            'wallet': result.wallet,
+            'score': result.score,
+            'risk': result.risk,
+            'factors': result.factors,
+            'confidence': result.confidence,
+        }
+        try:
+            await self.redis_client.setex(f"credit_scorer:{wallet}", CACHE_TTL, json.dumps(data))
+        except Exception as e:
+            print(f"Failed to cache credit score: {e}")
+
+    async def _known_no_lending(self, wallet: str, tx_count: int) -> bool:
+        """
+        True if an earlier scan found no lending events and no tx happened since
+
+        ``tx_count`` must be the explorer's real count (see ``_tx_count``): a
+        marker only goes stale once the count moves past the recorded one.
+        """
+        seen = _get_no_lending(wallet)
+        if seen is None and self.redis_client:
+            try:
+                cached = await self.redis_client.get(f"credit_scorer:noevents:{wallet}")
+            except Exception as e:
+                print(f"Cache error: {e}")
+                cached = None
+            if cached is not None:
+                seen = int(cached)
+                _set_no_lending(wallet, seen)
+        return seen is not None and tx_count <= seen
+
+    async def _mark_no_lending(self, wallet: str, tx_count: int) -> None:
+        _set_no_lending(wallet, tx_count)
+        if not self.redis_client:
+            return
+        try:
+            await self.redis_client.setex(
+                f"credit_scorer:noevents:{wallet}", NO_LENDING_TTL, str(tx_count)
+            )
+        except Exception as e:
+            print(f"Failed to cache lending scan result: {e}")
+
     # ---------- public API ---------------------------------------------- #
 
     async def calculate_async(self, wallet: str) -> CreditScore:
         """Async version of calculate method with real SEI services"""
-        wallet = Web3.to_checksum_address(wallet)
+        wallet = checksum_address(wallet)
         
         # Check cache first
-        cached = _get_cached(wallet)
+        cached = _get_cached(wallet) or await self._get_shared_cached(wallet)
         if cached:
             print(f"   ➜ Using cached score for {wallet}")
-            return CreditScore(**cached)
-
-        # --- metadata & fast early cutoff ------------------------------- #
-        first_ts, first_blk = self.provider.first_tx_info(wallet)
-        counters = self.provider.counters(wallet)
-        days_old = (
-            (_dt.datetime.utcnow().replace(tzinfo=_dt.timezone.utc) - first_ts).days
-            if first_ts
-            else None
-        )
-
-        native_bal = get_wallet_balance(wallet)  # reuse working helper
-
-        # For faster testing, use a more recent starting block if wallet has no history
-        latest_block = self.provider.w3.eth.block_number
-        if first_blk is None:
-            # Start from ~7 days ago (assuming ~2s block time = 302,400 blocks per week)
-            start_blk = max(0, latest_block - 302_400)
-            print(f"   ➜ No transaction history found, scanning from recent block {start_blk}")
-        else:
-            start_blk = first_blk
-            print(f"   ➜ Wallet first seen at block {start_blk}")
-
-        # Try to get lending events, but don't fail if it's slow
-        lend_events = []
-        try:
-            print(f"   ➜ Scanning lending events (this may take a moment)...")
-            lend_events = lending_history(wallet, self.pool, self.provider.w3, start_blk)
-            print(f"   ➜ Found {len(lend_events)} lending events")
-        except Exception as e:
-            print(f"   ⚠️  Lending events scan failed: {e}")
-            print(f"   ➜ Continuing with basic scoring...")
-
-        # Fetch additional SEI-native data using async services
-        staking, governance = await asyncio.gather(
+            return cached
+
+        # --- metadata, balances & SEI-native data, fetched concurrently -- #
+        (
+            (first_ts, first_blk),
+            counters,
+            native_bal,
+            _,  # warms latest_block's cache for the lending scan
+            staking,
+            governance,
+        ) = await asyncio.gather(
+            self.provider.afirst_tx_info(wallet),
+            self.provider.acounters(wallet),
+            asyncio.to_thread(get_wallet_balance, wallet),  # reuse working helper
+            asyncio.to_thread(latest_block, self.provider.w3),
             self._fetch_staking(wallet),
             self._fetch_governance(wallet),
-            return_exceptions=True
         )
-        
-        # Handle exceptions from async calls
-        if isinstance(staking, Exception):
-            print(f"   ⚠️  Staking data fetch failed: {staking}")
-            staking = StakingMetrics(
-                bonded_amount=0.0, active_epochs=0, total_rewards=0.0,
-                slashing_penalties=0.0, delegation_count=0, last_delegation_epoch=None,
-                staking_duration_days=0, is_active_staker=False
-            )
-        
-        if isinstance(governance, Exception):
-            print(f"   ⚠️  Governance data fetch failed: {governance}")
-            governance = GovernanceMetrics(
-                total_votes_cast=0, proposals_participated=0, recent_votes_90d=0,
-                voting_power_used=0.0, last_vote_timestamp=None, participation_rate=0.0,
-                is_active_voter=False, governance_score=0.0
-            )
+        now = time.time()
+        days_old = int((now - first_ts) // 86400) if first_ts is not None else None
+
+        # A wallet with no transactions cannot have lending events, so skip
+        # the eth_getLogs scan entirely and score the other pillars
+        lend_events = []
+        tx_count = _tx_count(counters)
+        has_history = tx_count != 0 and first_blk is not None
+        if not has_history:
+            print("   ➜ No transaction history found, skipping lending events scan")
+        elif await self._known_no_lending(wallet, tx_count):
+            # Same answer as the last scan until the wallet transacts again
+            print("   ➜ No lending events at last scan and no new transactions, skipping scan")
+        else:
+            print(f"   ➜ Wallet first seen at block {first_blk}")
+            # Try to get lending events, but don't fail if it's slow
+            try:
+                print(f"   ➜ Scanning lending events (this may take a moment)...")
+                # The scan is blocking HTTP; keep it off the event loop so
+                # other requests on this loop are served meanwhile
+                lend_events = await asyncio.to_thread(
+                    lending_history,
+                    wallet,
+                    self.pool,
+                    self.provider.w3,
+                    first_blk,
+                    events=self.lending_events,
+                    log_cache=self.log_cache,
+                )
+                print(f"   ➜ Found {len(lend_events)} lending events")
+                if not lend_events:
+                    await self._mark_no_lending(wallet, tx_count)
+            except Exception as e:
+                print(f"   ⚠️  Lending events scan failed: {e}")
+                print(f"   ➜ Continuing with basic scoring...")
 
         # --- pillar scores ---------------------------------------------- #
         s_age = self._score_age(days_old)
-        s_tx = self._score_transactions(counters.get("transaction_count", 0))
+        s_tx = self._score_transactions(tx_count)
         s_bal = self._score_balances(native_bal)
         s_rep = self._score_repayment(lend_events)
         s_defi = self._score_defi_extras(len(counters.get("unique_addresses", [])))
@@ -481,24 +945,15 @@ class DeFiCreditScorer:
         )
         final = max(0, min(1000, int(round(raw))))
 
-        risk = (
-            "Very Low Risk"
-            if final >= 850
-            else "Low Risk"
-            if final >= 700
-            else "Medium Risk"
-            if final >= 500
-            else "High Risk"
-            if final >= 300
-            else "Very High Risk"
-        )
+        risk = _RISK_LABELS[bisect_right(_RISK_TH, final)]
 
         # Calculate confidence
         user_data = {
-            'transactions': counters.get("transaction_count", 0),
+            'transactions': tx_count,
             'first_tx_info': first_ts is not None,
             'counters': counters,
-            'days_old': days_old or 0
+            'days_old': days_old or 0,
+            'lending_scanned': has_history,
         }
         confidence = self._calculate_confidence({
             "Account Age": s_age,
@@ -527,26 +982,45 @@ class DeFiCreditScorer:
         )
 
         # Cache the result
-        _set_cached(wallet, {
-            'wallet': wallet,
-            'score': final,
-            'risk': risk,
-            'factors': result.factors,
-            'confidence': confidence,
-        })
+        _set_cached(wallet, result)
+        await self._set_shared_cached(wallet, result)
 
         return result
 
+    async def calculate_many(self, wallets: List[str]) -> List[CreditScore]:
+        """
+        Score several wallets, at most SCORE_CONCURRENCY at a time.
+
+        Results follow the order of `wallets`; repeated addresses are scored
+        once. An invalid address raises, as with calculate_async.
+        """
+        sem = asyncio.Semaphore(SCORE_CONCURRENCY)
+
+        async def score(wallet: str) -> CreditScore:
+            async with sem:
+                return await self.calculate_async(wallet)
+
+        unique = list(dict.fromkeys(checksum_address(w) for w in wallets))
+        scores = dict(zip(unique, await asyncio.gather(*(score(w) for w in unique))))
+        return [scores[checksum_address(w)] for w in wallets]
+
+    async def _calculate_once(self, wallet: str) -> CreditScore:
+        """calculate_async on a throwaway loop, closing that loop's HTTP session"""
+        try:
+            return await self.calculate_async(wallet)
+        finally:
+            await close_http_session()
+
     def calculate(self, wallet: str) -> CreditScore:
         """Synchronous wrapper for async calculate method"""
         try:
-            return asyncio.run(self.calculate_async(wallet))
+            return asyncio.run(self._calculate_once(wallet))
         except RuntimeError:
             # If already in event loop, create new one
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
             try:
-                return loop.run_until_complete(self.calculate_async(wallet))
+                return loop.run_until_complete(self._calculate_once(wallet))
             finally:
                 loop.close()
 
@@ -572,6 +1046,13 @@ if __name__ == "__main__":
     )
     ns = ap.parse_args()
 
+    # Same fast event loop uvicorn picks up for the API servers
+    try:
+        import uvloop  # installed with uvicorn[standard]
+        uvloop.install()
+    except ImportError:
+        pass
+
     scorer = DeFiCreditScorer(lending_pool_addr=ns.pool)
     result = scorer.calculate(ns.wallet)
 
@@ -0,0 +1,137 @@
+"""
+Lending log cache
+SQLite store of lending-pool events already scanned per wallet, so a repeat
+score only scans the blocks produced since the previous one
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Set LENDING_LOG_CACHE_DB to "" to disable the cache
+LOG_CACHE_PATH = os.getenv(
+    "LENDING_LOG_CACHE_DB", str(Path(__file__).resolve().parent / "cache.db")
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scanned_ranges (
+    pool TEXT NOT NULL,
+    wallet TEXT NOT NULL,
+    from_block INTEGER NOT NULL,
+    to_block INTEGER NOT NULL,
+    PRIMARY KEY (pool, wallet)
+);
+CREATE TABLE IF NOT EXISTS logs (
+    pool TEXT NOT NULL,
+    wallet TEXT NOT NULL,
+    block INTEGER NOT NULL,
+    tx TEXT NOT NULL,
+    log_index INTEGER NOT NULL,
+    event_json TEXT NOT NULL,
+    PRIMARY KEY (pool, wallet, tx, log_index)
+);
+"""
+
+
+class LendingLogCache:
+    """
+    Contiguous scanned block range and decoded events per (pool, wallet).
+
+    One connection is shared by every thread; the lock serialises access.
+    Cache failures are logged and treated as misses so scoring never depends
+    on the local disk.
+    """
+
+    def __init__(self, path: str = LOG_CACHE_PATH):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def scanned_range(self, pool: str, wallet: str) -> Optional[Tuple[int, int]]:
+        """(from_block, to_block) already scanned for wallet, or None"""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT from_block, to_block FROM scanned_ranges WHERE pool = ? AND wallet = ?",
+                    (pool, wallet),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Log cache read failed: {e}")
+            return None
+        return (row[0], row[1]) if row else None
+
+    def events(self, pool: str, wallet: str, from_block: int = 0) -> List[Dict[str, Any]]:
+        """Cached events at or after from_block, in block order"""
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT event_json FROM logs WHERE pool = ? AND wallet = ? AND block >= ? "
+                    "ORDER BY block, log_index",
+                    (pool, wallet, from_block),
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Log cache read failed: {e}")
+            return []
+        return [json.loads(row[0]) for row in rows]
+
+    def record(
+        self,
+        pool: str,
+        wallet: str,
+        from_block: int,
+        to_block: int,
+        events: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Store newly scanned events and set the wallet's scanned range to
+        [from_block, to_block]; the caller guarantees it is contiguous.
+        """
+        rows = [
+            (pool, wallet, ev["block"], ev["tx"], ev.get("logIndex", 0), json.dumps(ev, default=str))
+            for ev in events
+        ]
+        try:
+            with self._lock:
+                self._conn.execute("BEGIN")
+                try:
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO logs VALUES (?, ?, ?, ?, ?, ?)", rows
+                    )
+                    self._conn.execute(
+                        "INSERT INTO scanned_ranges VALUES (?, ?, ?, ?) "
+                        "ON CONFLICT (pool, wallet) DO UPDATE SET "
+                        "from_block = excluded.from_block, to_block = excluded.to_block",
+                        (pool, wallet, from_block, to_block),
+                    )
+                    self._conn.execute("COMMIT")
+                except sqlite3.Error:
+                    self._conn.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error as e:
+            logger.warning(f"Log cache write failed: {e}")
+
+
+_LOG_CACHE: Optional[LendingLogCache] = None
+_LOG_CACHE_LOCK = threading.Lock()
+
+
+def get_log_cache() -> Optional[LendingLogCache]:
+    """Process-wide cache, opened on first use; None if disabled or unusable"""
+    global _LOG_CACHE
+    if _LOG_CACHE is None and LOG_CACHE_PATH:
+        with _LOG_CACHE_LOCK:
+            if _LOG_CACHE is None:
+                try:
+                    _LOG_CACHE = LendingLogCache(LOG_CACHE_PATH)
+                except sqlite3.Error as e:
+                    logger.warning(f"Lending log cache disabled: {e}")
+                    return None
+    return _LOG_CACHE
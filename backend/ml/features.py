@@ -158,25 +158,27 @@ class FeatureExtractor:
             }
         
         try:
-            # Sort transactions by timestamp
-            sorted_txs = sorted(transactions, key=lambda x: x.get('timestamp', 0))
+            # Pull timestamps into one sorted array; every feature below is a
+            # vectorised reduction over it rather than a walk over the dicts
+            timestamps = np.sort(np.fromiter(
+                (tx.get('timestamp', 0) for tx in transactions),
+                dtype=np.float64,
+                count=len(transactions),
+            ))
             
             # Calculate transaction velocity (transactions per day)
-            if len(sorted_txs) > 1:
-                time_span = sorted_txs[-1]['timestamp'] - sorted_txs[0]['timestamp']
+            if timestamps.size > 1:
+                time_span = timestamps[-1] - timestamps[0]
                 days_span = max(1, time_span / (24 * 3600))
-                velocity = len(sorted_txs) / days_span
+                velocity = float(timestamps.size / days_span)
             else:
                 velocity = 0.0
             
             # Calculate inter-arrival times
-            inter_arrival_times = []
-            for i in range(1, len(sorted_txs)):
-                interval = sorted_txs[i]['timestamp'] - sorted_txs[i-1]['timestamp']
-                if interval > 0:
-                    inter_arrival_times.append(interval)
+            inter_arrival_times = np.diff(timestamps)
+            inter_arrival_times = inter_arrival_times[inter_arrival_times > 0]
             
-            if inter_arrival_times:
+            if inter_arrival_times.size:
                 # Calculate burstiness (coefficient of variation)
                 mean_interval = np.mean(inter_arrival_times)
                 std_interval = np.std(inter_arrival_times)
@@ -187,7 +189,7 @@ class FeatureExtractor:
                 
                 # Calculate periodicity (regularity of timing)
                 # Use autocorrelation of inter-arrival times
-                if len(inter_arrival_times) > 1:
+                if inter_arrival_times.size > 1:
                     autocorr = np.corrcoef(inter_arrival_times[:-1], inter_arrival_times[1:])[0, 1]
                     periodicity = max(0, autocorr) if not np.isnan(autocorr) else 0.0
                 else:
@@ -233,8 +235,15 @@ class FeatureExtractor:
                     'volatile_ratio': 0.0,
                 }
             
+            # Token values as one column, aligned with per-token category masks
+            values = np.fromiter(
+                (token.get('value_usd', 0) for token in tokens),
+                dtype=np.float64,
+                count=len(tokens),
+            )
+            
             # Calculate total value
-            total_value = sum(token.get('value_usd', 0) for token in tokens)
+            total_value = values.sum()
             if total_value == 0:
                 return {
                     'diversity': 0.0,
@@ -244,28 +253,22 @@ class FeatureExtractor:
                 }
             
             # Calculate Herfindahl index for diversity
-            proportions = [token.get('value_usd', 0) / total_value for token in tokens]
-            diversity = 1 - sum(p**2 for p in proportions)  # Inverse Herfindahl
-            
-            # Calculate token type ratios
-            bluechip_value = 0
-            stable_value = 0
-            volatile_value = 0
-            
-            for token in tokens:
-                token_address = token.get('address', '').lower()
-                value = token.get('value_usd', 0)
-                
-                if token_address in self.bluechip_tokens:
-                    bluechip_value += value
-                elif token_address in self.stablecoins:
-                    stable_value += value
-                else:
-                    volatile_value += value
+            proportions = values / total_value
+            diversity = float(1 - proportions @ proportions)  # Inverse Herfindahl
+            
+            # Calculate token type ratios; blue-chip takes precedence over
+            # stablecoin for tokens listed in both
+            addresses = [token.get('address', '').lower() for token in tokens]
+            is_bluechip = np.fromiter(
+                (addr in self.bluechip_tokens for addr in addresses), dtype=bool, count=len(addresses)
+            )
+            is_stable = ~is_bluechip & np.fromiter(
+                (addr in self.stablecoins for addr in addresses), dtype=bool, count=len(addresses)
+            )
             
-            bluechip_ratio = bluechip_value / total_value
-            stable_ratio = stable_value / total_value
-            volatile_ratio = volatile_value / total_value
+            bluechip_ratio = float(proportions @ is_bluechip)
+            stable_ratio = float(proportions @ is_stable)
+            volatile_ratio = float(proportions @ ~(is_bluechip | is_stable))
             
             return {
                 'diversity': diversity,
@@ -24,11 +24,13 @@ try:
     from .services.sei_staking import SEIStakingService, StakingMetrics
     from .services.sei_governance import SEIGovernanceService, GovernanceMetrics
     from .credit_scorer import DeFiCreditScorer
+    from .rpc_client import close_http_session
 except ImportError:
     # Fallback for when running directly
     from services.sei_staking import SEIStakingService, StakingMetrics
     from services.sei_governance import SEIGovernanceService, GovernanceMetrics
     from credit_scorer import DeFiCreditScorer
+    from rpc_client import close_http_session
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -400,6 +402,11 @@ class ProductionCreditTracker:
         async def startup_event():
             await self.startup()
         
+        @self.app.on_event("shutdown")
+        async def shutdown_event():
+            # Release the pooled keep-alive connections of the shared session
+            await close_http_session()
+        
         @self.app.get("/v1/score/{wallet}", response_model=CreditScoreResponse)
         async def get_credit_score_v1(
             request: Request,
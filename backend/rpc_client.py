@@ -0,0 +1,195 @@
+"""
+Async JSON-RPC client
+Pooled aiohttp transport shared by every chain adapter and service
+"""
+
+import asyncio
+import logging
+import os
+import weakref
+from typing import Any, Dict, List, Sequence, Tuple
+
+import aiohttp
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    orjson = None
+    import json
+
+logger = logging.getLogger(__name__)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Parse JSON bytes or text (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# One keep-alive HTTP session per event loop, shared by every adapter so RPC
+# calls reuse warm TCP/TLS connections instead of handshaking each time
+_HTTP_SESSIONS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """
+    Get the shared HTTP session for the running event loop
+    
+    Returns:
+        aiohttp.ClientSession backed by a pooled keep-alive connector
+    """
+    loop = asyncio.get_running_loop()
+    session = _HTTP_SESSIONS.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=64,
+            keepalive_timeout=90,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            headers={"Content-Type": "application/json"},
+        )
+        _HTTP_SESSIONS[loop] = session
+    return session
+
+
+async def close_http_session() -> None:
+    """Close the shared HTTP session for the running event loop"""
+    session = _HTTP_SESSIONS.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+# Upper bound on concurrent in-flight requests per RPC endpoint. The SEI
+# endpoint takes the bulk of adapter and service traffic, so it gets its own
+RPC_MAX_INFLIGHT = int(os.getenv("RPC_MAX_INFLIGHT", "8"))
+SEI_RPC_MAX_INFLIGHT = int(os.getenv("SEI_RPC_MAX_INFLIGHT", "16"))
+RPC_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class RpcPool:
+    """
+    Bounded-concurrency JSON-RPC client for a single endpoint
+    
+    Caps in-flight requests with a semaphore so bursts of concurrent
+    adapter calls queue locally instead of overwhelming the provider,
+    and retries timeouts, dropped connections and rate-limit / 5xx
+    responses with exponential backoff (100ms, 200ms, 400ms).
+    """
+    
+    def __init__(self, url: str, size: int = RPC_MAX_INFLIGHT, retries: int = 3):
+        self.url = url
+        self.sem = asyncio.Semaphore(size)
+        self.retries = retries
+    
+    async def call(self, payload: Any, timeout: float = 10) -> Any:
+        """
+        POST a JSON-RPC payload (single request or batch)
+        
+        Args:
+            payload: JSON-RPC request object or list of them
+            timeout: Total request timeout in seconds
+            
+        Returns:
+            Decoded JSON response
+        """
+        body = json_dumps(payload)
+        for attempt in range(self.retries + 1):
+            last = attempt == self.retries
+            try:
+                async with self.sem:
+                    async with get_http_session().post(
+                        self.url,
+                        data=body,
+                        timeout=aiohttp.ClientTimeout(total=timeout),
+                    ) as resp:
+                        if resp.status not in RPC_RETRY_STATUSES or last:
+                            resp.raise_for_status()
+                            return json_loads(await resp.read())
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError) as e:
+                if last:
+                    raise
+                logger.warning(
+                    f"RPC {type(e).__name__} from {self.url}, retrying ({attempt + 1}/{self.retries})"
+                )
+            # Back off outside the semaphore so waiting calls can proceed
+            await asyncio.sleep(2 ** attempt * 0.1)
+
+
+# RPC pools per event loop, keyed by endpoint URL
+_RPC_POOLS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, RpcPool]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_rpc_pool(url: str) -> RpcPool:
+    """Get the shared RpcPool for ``url`` on the running event loop"""
+    pools = _RPC_POOLS.setdefault(asyncio.get_running_loop(), {})
+    pool = pools.get(url)
+    if pool is None:
+        size = SEI_RPC_MAX_INFLIGHT if url == RPC_URL else RPC_MAX_INFLIGHT
+        pool = pools[url] = RpcPool(url, size)
+    return pool
+
+
+DEFAULT_RPC_URL = "https://evm-rpc.sei-apis.com"
+RPC_URL = os.getenv("SEI_RPC_URL", DEFAULT_RPC_URL)
+RPC_TIMEOUT = 10
+
+
+async def rpc(method: str, params: list, url: str = RPC_URL) -> Any:
+    """
+    Issue a single JSON-RPC call
+    
+    Args:
+        method: JSON-RPC method name, e.g. ``eth_getCode``
+        params: Method parameters
+        url: RPC endpoint (defaults to the SEI EVM RPC)
+        
+    Returns:
+        The call's ``result``
+    """
+    response = await get_rpc_pool(url).call(
+        {"jsonrpc": "2.0", "id": 1, "method": method, "params": params},
+        timeout=RPC_TIMEOUT,
+    )
+    if "error" in response:
+        raise ConnectionError(f"{method} failed: {response['error']}")
+    return response.get("result")
+
+
+async def batch_rpc(calls: Sequence[Tuple[str, list]], url: str = RPC_URL) -> List[Any]:
+    """
+    Send ``calls`` as one JSON-RPC batch and return their results in order
+    
+    Calls the node answers with an error come back as ``None``. Providers
+    that reject batch requests are handled by falling back to concurrent
+    single calls.
+    """
+    payload = [
+        {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+        for i, (method, params) in enumerate(calls)
+    ]
+    response = await get_rpc_pool(url).call(payload, timeout=RPC_TIMEOUT)
+    if not isinstance(response, list):
+        logger.warning(f"Batch rejected by {url}, falling back to single calls")
+        results = await asyncio.gather(
+            *[rpc(method, params, url) for method, params in calls],
+            return_exceptions=True,
+        )
+        return [None if isinstance(r, Exception) else r for r in results]
+    
+    by_id = {item.get("id"): item for item in response if isinstance(item, dict)}
+    return [by_id.get(i, {}).get("result") for i in range(len(calls))]
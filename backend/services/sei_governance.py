@@ -6,6 +6,7 @@ Handles governance data fetching from SEI governance precompile contract
 import os
 import json
 import time
+import random
 import asyncio
 from typing import Dict, Optional, Any, List
 from dataclasses import dataclass
@@ -13,9 +14,15 @@ from web3 import Web3
 import redis.asyncio as redis
 import logging
 
+try:
+    from ..coin_balance import checksum_address
+except ImportError:
+    # Fallback for when running directly
+    from coin_balance import checksum_address
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class GovernanceMetrics:
     """Governance metrics for a wallet"""
     total_votes_cast: int
@@ -27,7 +34,7 @@ class GovernanceMetrics:
     is_active_voter: bool
     governance_score: float
 
-@dataclass
+@dataclass(slots=True)
 class ProposalInfo:
     """Information about a governance proposal"""
     proposal_id: int
@@ -95,7 +102,7 @@ class SEIGovernanceService:
         Returns:
             GovernanceMetrics object with governance data
         """
-        wallet_address = Web3.to_checksum_address(wallet_address)
+        wallet_address = checksum_address(wallet_address)
         cache_key = f"sei_governance:{wallet_address}"
         
         # Check cache first
@@ -166,7 +173,6 @@ class SEIGovernanceService:
             proposals = []
             
             # Mock: generate some proposal history
-            import random
             num_proposals = random.randint(0, 10)
             
             for i in range(num_proposals):
@@ -235,7 +241,6 @@ class SEIGovernanceService:
         try:
             # This would query governance events for vote count
             # Mock: return random number between 0-20
-            import random
             return random.randint(0, 20)
         except Exception as e:
             logger.error(f"Error getting total votes cast: {e}")
@@ -246,7 +251,6 @@ class SEIGovernanceService:
         try:
             # This would query unique proposal IDs from voting events
             # Mock: return random number between 0-10
-            import random
             return random.randint(0, 10)
         except Exception as e:
             logger.error(f"Error getting proposals participated: {e}")
@@ -257,7 +261,6 @@ class SEIGovernanceService:
         try:
             # This would query recent voting events
             # Mock: return random number between 0-5
-            import random
             return random.randint(0, 5)
         except Exception as e:
             logger.error(f"Error getting recent votes 90d: {e}")
@@ -268,7 +271,6 @@ class SEIGovernanceService:
         try:
             # This would sum up voting power from all votes
             # Mock: return random amount
-            import random
             return random.uniform(0.0, 50.0)
         except Exception as e:
             logger.error(f"Error getting voting power used: {e}")
@@ -279,7 +281,6 @@ class SEIGovernanceService:
         try:
             # This would query the most recent voting event
             # Mock: return timestamp from 0-90 days ago
-            import random
             current_time = int(time.time())
             days_ago = random.randint(0, 90)
             return current_time - (days_ago * 24 * 60 * 60)
@@ -292,7 +293,6 @@ class SEIGovernanceService:
         try:
             # This would calculate (proposals_voted / total_proposals_available)
             # Mock: return random rate between 0-1
-            import random
             return random.uniform(0.0, 1.0)
         except Exception as e:
             logger.error(f"Error getting participation rate: {e}")
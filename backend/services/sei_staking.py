@@ -6,6 +6,7 @@ Handles staking data fetching from SEI staking precompile contract
 import os
 import json
 import time
+import random
 import asyncio
 from typing import Dict, Optional, Any
 from dataclasses import dataclass
@@ -13,9 +14,15 @@ from web3 import Web3
 import redis.asyncio as redis
 import logging
 
+try:
+    from ..coin_balance import checksum_address
+except ImportError:
+    # Fallback for when running directly
+    from coin_balance import checksum_address
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class StakingMetrics:
     """Staking metrics for a wallet"""
     bonded_amount: float
@@ -84,7 +91,7 @@ class SEIStakingService:
         Returns:
             StakingMetrics object with staking data
         """
-        wallet_address = Web3.to_checksum_address(wallet_address)
+        wallet_address = checksum_address(wallet_address)
         cache_key = f"sei_staking:{wallet_address}"
         
         # Check cache first
@@ -198,7 +205,6 @@ class SEIStakingService:
         try:
             # This would query staking history
             # Mock: return random number between 0-50
-            import random
             return random.randint(0, 50)
         except Exception as e:
             logger.error(f"Error getting active epochs: {e}")
@@ -230,7 +236,6 @@ class SEIStakingService:
         try:
             # This would query delegation events
             # Mock: return 1-3 validators
-            import random
             return random.randint(1, 3)
         except Exception as e:
             logger.error(f"Error getting delegation count: {e}")
@@ -241,7 +246,6 @@ class SEIStakingService:
         try:
             # This would query recent delegation events
             # Mock: return current epoch - random days
-            import random
             current_epoch = self.w3.eth.block_number // 1000  # Approximate epoch
             return current_epoch - random.randint(0, 30)
         except Exception as e:
@@ -253,7 +257,6 @@ class SEIStakingService:
         try:
             # This would calculate from first delegation to now
             # Mock: return random duration
-            import random
             return random.randint(0, 365)
         except Exception as e:
             logger.error(f"Error getting staking duration: {e}")
@@ -33,12 +33,13 @@ def get_wallet_counters(wallet_address):
         print(f"Error: {e}")
         return None
 
-# Example usage with a specific wallet address
-wallet_address = "0x6Ae3539c7BB31AbCaCc2403e7F6091BC43D825FF"
-wallet_counters = get_wallet_counters(wallet_address)
+if __name__ == "__main__":
+    # Example usage with a specific wallet address
+    wallet_address = "0x6Ae3539c7BB31AbCaCc2403e7F6091BC43D825FF"
+    wallet_counters = get_wallet_counters(wallet_address)
 
-# Print the counters if available
-if wallet_counters:
-    print("Wallet counters:", wallet_counters)
-else:
-    print("No wallet counter details returned.")
+    # Print the counters if available
+    if wallet_counters:
+        print("Wallet counters:", wallet_counters)
+    else:
+        print("No wallet counter details returned.")